@@ -10,8 +10,6 @@ import logging
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from cli.scanner import PluginInfo
 
 logger = logging.getLogger(__name__)
@@ -25,6 +23,7 @@ def generate_config(
     server_port: int = 8321,
     auto_update: bool = False,
     install_commit: str = "",
+    dumper: type | None = None,
 ) -> tuple[Path, Path]:
     """Generate config.yaml and .env files from setup wizard results.
 
@@ -36,6 +35,7 @@ def generate_config(
         server_port: HTTP server bind port
         auto_update: Whether startup auto-update is enabled
         install_commit: Commit hash recorded at first setup/install
+        dumper: YAML Dumper class (default: libyaml CSafeDumper if available)
 
     Returns:
         Tuple of (config_path, env_path)
@@ -57,13 +57,18 @@ def generate_config(
         values = plugin_values.get(plugin.name, {})
         _add_plugin_to_config(config, secrets, plugin, values)
 
+    import yaml
+
+    if dumper is None:
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
     # Write config.yaml
     config_path = home_dir / "config.yaml"
     with open(config_path, "w") as f:
         f.write("# ClawQuant Configuration\n")
         f.write("# Generated by clawquant setup\n")
         f.write("# Edit freely -- re-run 'clawquant config' to regenerate\n\n")
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        yaml.dump(config, f, Dumper=dumper, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
     # Write .env
     env_path = home_dir / ".env"
@@ -0,0 +1,86 @@
+"""Checkout introspection -- which commit the install is running.
+
+Shared by the CLI entry point and the setup wizard. Standard library only,
+so importing it stays cheap for every command.
+"""
+
+from __future__ import annotations
+
+import functools
+from pathlib import Path
+
+
+def _is_commit_sha(value: str) -> bool:
+    return len(value) in (40, 64) and all(c in "0123456789abcdef" for c in value)
+
+
+def _read_head_commit(repo_root: Path) -> str:
+    """Resolve HEAD by reading .git directly; "" when git must be asked instead.
+
+    Handles loose and packed branch refs and detached HEAD. Worktrees (where
+    .git is a file), symbolic refs to other refs, etc. fall back to git.
+    """
+    git_dir = repo_root / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+        if not head.startswith("ref: "):
+            return head if _is_commit_sha(head) else ""
+
+        ref = head[5:].strip()
+        ref_path = git_dir / ref
+        if ref_path.is_file():
+            commit = ref_path.read_text().strip()
+            return commit if _is_commit_sha(commit) else ""
+
+        packed = git_dir / "packed-refs"
+        if packed.is_file():
+            for line in packed.read_text().splitlines():
+                if line.endswith(" " + ref):
+                    commit = line.split(" ", 1)[0]
+                    return commit if _is_commit_sha(commit) else ""
+    except OSError:
+        return ""
+    return ""
+
+
+def repo_head_stamp(repo_root: Path) -> str:
+    """Cheap fingerprint of where HEAD points, "" when .git/HEAD can't be stat'ed.
+
+    Combines the mtimes of .git/HEAD, the branch ref it names and packed-refs,
+    so it changes on checkout, commit and pull alike.
+    """
+    git_dir = repo_root / ".git"
+    try:
+        head_path = git_dir / "HEAD"
+        parts = [str(head_path.stat().st_mtime_ns)]
+        head = head_path.read_text().strip()
+    except OSError:
+        return ""
+    paths = [git_dir / head[5:].strip()] if head.startswith("ref: ") else []
+    paths.append(git_dir / "packed-refs")
+    for path in paths:
+        try:
+            parts.append(str(path.stat().st_mtime_ns))
+        except OSError:
+            parts.append("-")
+    return ":".join(parts)
+
+
+@functools.lru_cache(maxsize=8)
+def current_repo_commit(repo_root: Path) -> str:
+    """HEAD commit of the checkout, memoized per process (cleared after a pull)."""
+    commit = _read_head_commit(repo_root)
+    if commit:
+        return commit
+
+    import subprocess
+
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=repo_root,
+            stderr=subprocess.DEVNULL,
+            timeout=3,
+        ).decode("ascii", "replace").strip()
+    except (subprocess.SubprocessError, OSError):
+        return ""
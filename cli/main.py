@@ -15,11 +15,21 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import asyncio
+import copy
+import functools
+import hashlib
+import json
 import os
-import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from cli.gitinfo import current_repo_commit
+
+if TYPE_CHECKING:
+    import subprocess
 
 
 def get_home_dir() -> Path:
@@ -27,6 +37,95 @@ def get_home_dir() -> Path:
     return Path(os.environ.get("CLAWQUANT_HOME", Path.home() / ".clawquant")).expanduser()
 
 
+# Parsed config.yaml contents keyed by path -> (st_mtime_ns, st_size, data).
+_CONFIG_CACHE: dict[Path, tuple[int, int, dict]] = {}
+
+
+def _config_sidecar_path(path: Path) -> Path:
+    """JSON copy of a parsed YAML file, e.g. config.yaml -> config.yaml.cache.json."""
+    return path.with_name(path.name + ".cache.json")
+
+
+def _read_config_sidecar(path: Path, st: os.stat_result) -> dict | None:
+    try:
+        cached = json.loads(_config_sidecar_path(path).read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict):
+        return None
+    if cached.get("__mtime_ns") != st.st_mtime_ns or cached.get("__size") != st.st_size:
+        return None
+    data = cached.get("data")
+    return data if isinstance(data, dict) else None
+
+
+def _json_exact(value: object) -> bool:
+    """True when a JSON round-trip returns ``value`` unchanged (str keys, JSON types)."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return True
+    if isinstance(value, list):
+        return all(_json_exact(item) for item in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _json_exact(v) for k, v in value.items())
+    return False
+
+
+def _write_config_sidecar(path: Path, st: os.stat_result, data: dict) -> None:
+    """Best-effort atomic write; configs JSON can't represent exactly are not cached."""
+    if not _json_exact(data):
+        _config_sidecar_path(path).unlink(missing_ok=True)
+        return
+    sidecar = _config_sidecar_path(path)
+    tmp = sidecar.with_name(sidecar.name + ".tmp")
+    try:
+        payload = json.dumps({"__mtime_ns": st.st_mtime_ns, "__size": st.st_size, "data": data})
+        tmp.write_text(payload)
+        os.replace(tmp, sidecar)
+    except (OSError, TypeError, ValueError):
+        tmp.unlink(missing_ok=True)
+
+
+def _invalidate_config_cache(path: Path) -> None:
+    _CONFIG_CACHE.pop(path, None)
+    try:
+        _config_sidecar_path(path).unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def _load_yaml_cached(path: Path) -> dict:
+    """Parse a YAML mapping, reusing the last result while the file is unchanged.
+
+    Checks the in-process cache first, then the on-disk JSON sidecar, and
+    only falls back to YAML parsing (refreshing both) when the file changed.
+    """
+    st = path.stat()
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return copy.deepcopy(cached[2])
+
+    data = _read_config_sidecar(path, st)
+    if data is None:
+        data = _load_yaml(path)
+        _write_config_sidecar(path, st, data)
+    _CONFIG_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    return copy.deepcopy(data)
+
+
+def _load_yaml(path: Path) -> dict:
+    """Parse a YAML mapping straight from disk.
+
+    Used by everything that writes the file back, so the caches can never
+    leak into config.yaml.
+    """
+    import yaml
+
+    # Prefer the libyaml C loader; fall back to pure Python when unavailable.
+    with open(path) as f:
+        return yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}
+
+
+@functools.lru_cache(maxsize=1)
 def _repo_root() -> Path:
     return Path(__file__).resolve().parent.parent
 
@@ -48,13 +147,10 @@ def _as_bool(value: object, default: bool = False) -> bool:
 
 def _load_update_preferences(config_path: Path) -> tuple[bool, str]:
     """Read updates.auto_update and updates.install_commit from config.yaml."""
-    import yaml
-
     if not config_path.exists():
         return False, ""
     try:
-        with open(config_path) as f:
-            config = yaml.safe_load(f) or {}
+        config = _load_yaml_cached(config_path)
     except Exception:
         return False, ""
 
@@ -67,44 +163,43 @@ def _load_update_preferences(config_path: Path) -> tuple[bool, str]:
     return auto_update, install_commit
 
 
-def _current_repo_commit(repo_root: Path) -> str:
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=repo_root,
-            capture_output=True,
-            text=True,
-        )
-    except Exception:
-        return ""
-    if result.returncode != 0:
-        return ""
-    return result.stdout.strip()
-
-
 def _save_install_commit(config_path: Path, commit_hash: str) -> None:
     if not commit_hash or not config_path.exists():
         return
 
-    import yaml
-
     try:
-        with open(config_path) as f:
-            config = yaml.safe_load(f) or {}
+        config = _load_yaml(config_path)
     except Exception:
         return
 
     updates = config.get("updates")
+    if isinstance(updates, dict) and updates.get("install_commit") == commit_hash:
+        # Nothing to change; leaving the file untouched also keeps its caches valid.
+        return
     if not isinstance(updates, dict):
         updates = {}
         config["updates"] = updates
     updates["install_commit"] = commit_hash
 
+    import yaml
+
     try:
         with open(config_path, "w") as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+            yaml.dump(
+                config,
+                f,
+                Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+                default_flow_style=False,
+                sort_keys=False,
+                allow_unicode=True,
+            )
     except Exception:
         return
+    finally:
+        _invalidate_config_cache(config_path)
+
+
+_REQUIREMENTS_STAMP = ".requirements.sha256"
 
 
 def _run_repo_update(
@@ -113,6 +208,8 @@ def _run_repo_update(
     config_path: Path | None = None,
 ) -> bool:
     """Pull latest code and optionally refresh dependencies."""
+    import subprocess
+
     if not (repo_root / ".git").exists():
         print(f"  Not a git checkout: {repo_root}")
         print("  Reinstall with the one-line installer, or update manually.")
@@ -143,7 +240,8 @@ def _run_repo_update(
     else:
         print("  Updated repository.")
 
-    commit_hash = _current_repo_commit(repo_root)
+    current_repo_commit.cache_clear()
+    commit_hash = current_repo_commit(repo_root)
     if config_path is not None and commit_hash:
         _save_install_commit(config_path, commit_hash)
         print(f"  Recorded install commit: {commit_hash[:12]}")
@@ -151,20 +249,57 @@ def _run_repo_update(
     if not refresh_dependencies:
         return True
 
+    return _refresh_dependencies(repo_root)
+
+
+def _requirements_digest(repo_root: Path) -> str:
+    """Fingerprint of requirements.txt and the interpreter pip installs into."""
+    try:
+        requirements = (repo_root / "requirements.txt").read_bytes()
+    except OSError:
+        return ""
+    digest = hashlib.sha256(requirements)
+    digest.update(f"\0{sys.executable}\0{sys.prefix}".encode())
+    return digest.hexdigest()
+
+
+def _refresh_dependencies(repo_root: Path) -> bool:
+    """pip install requirements.txt, skipped while the last successful install still matches."""
+    import subprocess
+
+    stamp_path = get_home_dir() / _REQUIREMENTS_STAMP
+    digest = _requirements_digest(repo_root)
+    try:
+        previous = stamp_path.read_text().strip()
+    except OSError:
+        previous = ""
+    if digest and digest == previous:
+        print("  Dependencies unchanged.")
+        return True
+
     try:
         subprocess.check_call(
             [sys.executable, "-m", "pip", "install", "--quiet", "-r", "requirements.txt"],
             cwd=repo_root,
         )
-        print("  Dependencies refreshed.")
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, OSError):
         print("  Repository updated, but dependency refresh failed.")
         print("  Run: pip install -r requirements.txt")
         return False
+
+    print("  Dependencies refreshed.")
+    # Only stamped once pip has exited 0
+    if digest:
+        try:
+            stamp_path.write_text(digest)
+        except OSError:
+            pass
     return True
 
 
 def _run_git(repo_root: Path, args: list[str], timeout_seconds: float = 6.0) -> subprocess.CompletedProcess | None:
+    import subprocess
+
     try:
         return subprocess.run(
             ["git", *args],
@@ -177,26 +312,63 @@ def _run_git(repo_root: Path, args: list[str], timeout_seconds: float = 6.0) ->
         return None
 
 
+_FETCH_STAMP = ".last_fetch"
+_FETCH_INTERVAL_SECONDS = 900
+
+
+def _should_fetch(home: Path) -> bool:
+    """True when the last background fetch is missing or older than the interval."""
+    try:
+        age = time.time() - (home / _FETCH_STAMP).stat().st_mtime
+    except OSError:
+        return True
+    return age > _FETCH_INTERVAL_SECONDS
+
+
+def _resolve_head_and_upstream(repo_root: Path) -> tuple[str, str] | None:
+    """Resolve (HEAD sha, upstream sha) with one git call; None without an upstream."""
+    import subprocess
+
+    try:
+        lines = subprocess.check_output(
+            ["git", "rev-parse", "HEAD", "@{u}"],
+            cwd=repo_root,
+            stderr=subprocess.DEVNULL,
+            timeout=3,
+        ).decode("ascii", "replace").split()
+    except (subprocess.SubprocessError, OSError):
+        return None
+    if len(lines) < 2:
+        return None
+    return lines[0], lines[1]
+
+
 def _count_commits_behind_upstream(repo_root: Path) -> int | None:
     """Return how many commits local HEAD is behind upstream; None if unknown."""
     if not (repo_root / ".git").exists():
         return None
 
     # Must have an upstream configured for the current branch.
-    upstream = _run_git(
-        repo_root,
-        ["rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}"],
-        timeout_seconds=3.0,
-    )
-    if upstream is None or upstream.returncode != 0:
+    resolved = _resolve_head_and_upstream(repo_root)
+    if resolved is None:
         return None
+    head, _upstream = resolved
 
-    # Refresh remote tracking refs best-effort; failures are treated as unknown.
-    fetched = _run_git(repo_root, ["fetch", "--quiet"], timeout_seconds=8.0)
-    if fetched is None or fetched.returncode != 0:
-        return None
-
-    counts = _run_git(repo_root, ["rev-list", "--left-right", "--count", "HEAD...@{u}"], timeout_seconds=3.0)
+    # Refresh remote tracking refs in the background so startup never waits on
+    # the network; the count below reflects the refs from the previous fetch.
+    home = get_home_dir()
+    if _should_fetch(home):
+        try:
+            (home / _FETCH_STAMP).touch()
+        except OSError:
+            pass
+        threading.Thread(
+            target=_run_git,
+            args=(repo_root, ["fetch", "--quiet"], 20.0),
+            daemon=True,
+        ).start()
+
+    counts = _run_git(repo_root, ["rev-list", "--left-right", "--count", f"{head}...@{{u}}"], timeout_seconds=3.0)
     if counts is None or counts.returncode != 0:
         return None
 
@@ -214,6 +386,35 @@ def _count_commits_behind_upstream(repo_root: Path) -> int | None:
         return None
 
 
+def _needs_pull(repo_root: Path) -> bool:
+    """True unless upstream is known to have no commits missing from HEAD.
+
+    Fetches synchronously (throttled by the same stamp as the background
+    fetch) so the comparison sees fresh remote-tracking refs. Any failure
+    answers True and leaves error reporting to `git pull`.
+    """
+    if not (repo_root / ".git").exists():
+        return True
+
+    home = get_home_dir()
+    if _should_fetch(home):
+        fetched = _run_git(repo_root, ["fetch", "--quiet"], timeout_seconds=8.0)
+        if fetched is None or fetched.returncode != 0:
+            return True
+        try:
+            (home / _FETCH_STAMP).touch()
+        except OSError:
+            pass
+
+    counts = _run_git(repo_root, ["rev-list", "--count", "HEAD..@{u}"], timeout_seconds=3.0)
+    if counts is None or counts.returncode != 0:
+        return True
+    try:
+        return int(counts.stdout.strip()) > 0
+    except ValueError:
+        return True
+
+
 def cmd_setup(args: argparse.Namespace) -> None:
     """Run the interactive setup wizard."""
     from cli.setup import run_setup
@@ -223,6 +424,8 @@ def cmd_setup(args: argparse.Namespace) -> None:
 
 def cmd_start(args: argparse.Namespace) -> None:
     """Start the ClawQuant server."""
+    import asyncio
+
     config_path = get_home_dir() / "config.yaml"
     if not config_path.exists():
         print("  No configuration found. Run 'clawquant setup' first.")
@@ -232,13 +435,16 @@ def cmd_start(args: argparse.Namespace) -> None:
     repo_root = _repo_root()
 
     # Keep recorded install commit aligned with local HEAD.
-    current_commit = _current_repo_commit(repo_root)
+    current_commit = current_repo_commit(repo_root)
     if current_commit and current_commit != install_commit:
         _save_install_commit(config_path, current_commit)
 
     if auto_update:
         print("  Auto-update is enabled. Checking for updates...")
-        _run_repo_update(repo_root, refresh_dependencies=True, config_path=config_path)
+        if _needs_pull(repo_root):
+            _run_repo_update(repo_root, refresh_dependencies=True, config_path=config_path)
+        else:
+            print("  Up to date.")
     else:
         behind = _count_commits_behind_upstream(repo_root)
         if behind and behind > 0:
@@ -254,6 +460,18 @@ def cmd_start(args: argparse.Namespace) -> None:
         pass
 
 
+_STATE_FILE_SUFFIXES = (".json", ".jsonl", ".md")
+
+
+def _scandir_entries(path: Path) -> dict[str, os.DirEntry]:
+    """Map child name -> DirEntry for a directory; empty if it does not exist."""
+    try:
+        with os.scandir(path) as it:
+            return {e.name: e for e in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
 def cmd_status(args: argparse.Namespace) -> None:
     """Show system status."""
     from cli.banner import print_banner
@@ -262,37 +480,52 @@ def cmd_status(args: argparse.Namespace) -> None:
     home = get_home_dir()
     config_path = home / "config.yaml"
 
+    # One directory listing answers every top-level existence question below.
+    entries = _scandir_entries(home)
+    config_exists = "config.yaml" in entries
+    db_exists = "db.sqlite" in entries
+
     print(f"  Home:     {home}")
-    print(f"  Config:   {config_path} ({'exists' if config_path.exists() else 'NOT FOUND'})")
-    print(f"  Database: {home / 'db.sqlite'} ({'exists' if (home / 'db.sqlite').exists() else 'NOT FOUND'})")
+    print(f"  Config:   {config_path} ({'exists' if config_exists else 'NOT FOUND'})")
+    print(f"  Database: {home / 'db.sqlite'} ({'exists' if db_exists else 'NOT FOUND'})")
     print()
 
     # Count state files
     dirs = {
-        "Signals": home / "signals",
-        "Positions (AI)": home / "positions" / "ai",
-        "Positions (Human)": home / "positions" / "human",
-        "Memories": home / "memories",
-        "Tasks": home / "tasks",
-        "Memos": home / "memos",
-        "Event logs": home / "events",
+        "Signals": ("signals",),
+        "Positions (AI)": ("positions", "ai"),
+        "Positions (Human)": ("positions", "human"),
+        "Memories": ("memories",),
+        "Tasks": ("tasks",),
+        "Memos": ("memos",),
+        "Event logs": ("events",),
     }
 
-    for label, path in dirs.items():
-        if path.exists():
-            count = len(list(path.glob("*.json")) + list(path.glob("*.jsonl")) + list(path.glob("*.md")))
-            if count:
-                print(f"  {label}: {count} files")
+    for label, parts in dirs.items():
+        top = entries.get(parts[0])
+        if top is None or not top.is_dir():
+            continue
+        count = 0
+        try:
+            with os.scandir(os.path.join(top.path, *parts[1:])) as it:
+                for e in it:
+                    if e.name.endswith(_STATE_FILE_SUFFIXES) and e.is_file(follow_symlinks=False):
+                        count += 1
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        if count:
+            print(f"  {label}: {count} files")
 
     # Show discovered plugins
     print()
     from cli.scanner import discover_plugins, CATEGORY_LABELS
     plugins = discover_plugins()
-    for cat, items in plugins.items():
-        names = ", ".join(p.display_name for p in items)
-        print(f"  {CATEGORY_LABELS.get(cat, cat)}: {names}")
-
-    print()
+    lines = [
+        f"  {CATEGORY_LABELS.get(cat, cat)}: {', '.join(p.display_name for p in items)}"
+        for cat, items in plugins.items()
+    ]
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_config(args: argparse.Namespace) -> None:
@@ -328,14 +561,36 @@ def _plugin_list() -> None:
     from cli.scanner import discover_plugins, CATEGORY_LABELS
 
     plugins = discover_plugins()
-    print()
+    lines = [""]
     for cat, items in plugins.items():
-        print(f"  {CATEGORY_LABELS.get(cat, cat)}:")
+        lines.append(f"  {CATEGORY_LABELS.get(cat, cat)}:")
         for p in items:
             deps = f" [requires: {', '.join(p.pip_dependencies)}]" if p.pip_dependencies else ""
             fields = f" ({len(p.config_fields)} config fields)" if p.config_fields else ""
-            print(f"    {p.name:20s} {p.display_name}{fields}{deps}")
-        print()
+            lines.append(f"    {p.name:20s} {p.display_name}{fields}{deps}")
+        lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+# Config sections that hold per-plugin entries keyed by plugin name.
+_PLUGIN_SECTION_PATHS: tuple[tuple[str, ...], ...] = (
+    ("integrations",),
+    ("ai", "providers"),
+    ("ai", "agents"),
+    ("market_data", "providers"),
+    ("risk", "rules"),
+    ("scheduler", "handlers"),
+)
+
+
+def _config_section(config: dict, path: tuple[str, ...]) -> dict | None:
+    """Walk nested mapping keys, returning None if any level is missing or not a dict."""
+    node: object = config
+    for key in path:
+        if not isinstance(node, dict):
+            return None
+        node = node.get(key)
+    return node if isinstance(node, dict) else None
 
 
 def _plugin_toggle(name: str | None, enable: bool) -> None:
@@ -344,7 +599,6 @@ def _plugin_toggle(name: str | None, enable: bool) -> None:
         print("  Usage: clawquant plugin enable <name>")
         return
 
-    import yaml
     home = get_home_dir()
     config_path = home / "config.yaml"
 
@@ -352,57 +606,28 @@ def _plugin_toggle(name: str | None, enable: bool) -> None:
         print("  No config file. Run 'clawquant setup' first.")
         return
 
-    with open(config_path) as f:
-        config = yaml.safe_load(f) or {}
+    config = _load_yaml(config_path)
 
-    def _enable_flag(entry: object) -> bool:
+    found = False
+    for section_path in _PLUGIN_SECTION_PATHS:
+        section = _config_section(config, section_path)
+        entry = section.get(name) if section is not None else None
         if isinstance(entry, dict):
             entry["enabled"] = enable
-            return True
-        return False
-
-    found = False
-
-    # integrations.<name>
-    integrations = config.get("integrations")
-    if isinstance(integrations, dict) and name in integrations:
-        found = _enable_flag(integrations.get(name)) or found
-
-    # ai.providers.<name>
-    ai = config.get("ai")
-    if isinstance(ai, dict):
-        providers = ai.get("providers")
-        if isinstance(providers, dict) and name in providers:
-            found = _enable_flag(providers.get(name)) or found
-
-        agents = ai.get("agents")
-        if isinstance(agents, dict) and name in agents:
-            found = _enable_flag(agents.get(name)) or found
-
-    # market_data.providers.<name>
-    market_data = config.get("market_data")
-    if isinstance(market_data, dict):
-        providers = market_data.get("providers")
-        if isinstance(providers, dict) and name in providers:
-            found = _enable_flag(providers.get(name)) or found
-
-    # risk.rules.<name>
-    risk = config.get("risk")
-    if isinstance(risk, dict):
-        rules = risk.get("rules")
-        if isinstance(rules, dict) and name in rules:
-            found = _enable_flag(rules.get(name)) or found
-
-    # scheduler.handlers.<name>
-    scheduler = config.get("scheduler")
-    if isinstance(scheduler, dict):
-        handlers = scheduler.get("handlers")
-        if isinstance(handlers, dict) and name in handlers:
-            found = _enable_flag(handlers.get(name)) or found
+            found = True
 
     if found:
+        import yaml
+
         with open(config_path, "w") as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                config,
+                f,
+                Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+                default_flow_style=False,
+                sort_keys=False,
+            )
+        _invalidate_config_cache(config_path)
         action = "Enabled" if enable else "Disabled"
         print(f"  {action}: {name}")
     else:
@@ -456,15 +681,12 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main() -> None:
-    """CLI entrypoint."""
-    parser = build_parser()
-    args = parser.parse_args()
+# Commands that take no arguments; a bare `clawquant <cmd>` skips argparse.
+_NO_ARG_COMMANDS = frozenset({"setup", "start", "status", "update", "config"})
 
-    if args.command is None:
-        parser.print_help()
-        sys.exit(0)
 
+def main() -> None:
+    """CLI entrypoint."""
     commands = {
         "setup": cmd_setup,
         "start": cmd_start,
@@ -474,6 +696,19 @@ def main() -> None:
         "plugin": cmd_plugin,
     }
 
+    argv = sys.argv[1:]
+    if len(argv) == 1 and argv[0] in _NO_ARG_COMMANDS:
+        args = argparse.Namespace(command=argv[0], home=None)
+        commands[argv[0]](args)
+        return
+
+    parser = build_parser()
+    args = parser.parse_args()
+
+    if args.command is None:
+        parser.print_help()
+        sys.exit(0)
+
     handler = commands.get(args.command)
     if handler:
         handler(args)
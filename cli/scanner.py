@@ -9,8 +9,11 @@ appears in the setup wizard and CLI.
 from __future__ import annotations
 
 import ast
+import functools
 import importlib
+import json
 import logging
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -27,6 +30,9 @@ CATEGORY_ORDER = [
     "task_handler",
 ]
 
+# Extracted PLUGIN_META dicts, persisted under the home dir across CLI runs.
+PLUGIN_CACHE_FILENAME = "plugins.cache.json"
+
 CATEGORY_LABELS = {
     "ai_provider": "AI Providers",
     "market_data": "Market Data Sources",
@@ -37,7 +43,7 @@ CATEGORY_LABELS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigField:
     """A single configuration field for a plugin."""
 
@@ -53,7 +59,7 @@ class ConfigField:
     hidden: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PluginInfo:
     """Discovered plugin metadata."""
 
@@ -70,70 +76,124 @@ class PluginInfo:
     config_fields: list[ConfigField]
     auto_enable: bool = True
 
-    @property
-    def category_label(self) -> str:
-        return CATEGORY_LABELS.get(self.category, self.category)
-
-    @property
-    def has_config(self) -> bool:
-        return len(self.config_fields) > 0
+    # Derived labels/flags, computed once in __post_init__ (wizard flows read
+    # them repeatedly per plugin).
+    category_label: str = field(init=False, repr=False, compare=False)
+    has_config: bool = field(init=False, repr=False, compare=False)
+    has_secrets: bool = field(init=False, repr=False, compare=False)
+    choice_label: str = field(init=False, repr=False, compare=False)  # wizard checkbox label
 
-    @property
-    def has_secrets(self) -> bool:
-        return any(f.type == "secret" for f in self.config_fields)
-
-    @property
-    def choice_label(self) -> str:
-        """Label shown in the setup wizard checkbox list."""
-        return f"{self.display_name} -- {self.description}"
+    def __post_init__(self) -> None:
+        self.category_label = CATEGORY_LABELS.get(self.category, self.category)
+        self.has_config = len(self.config_fields) > 0
+        self.has_secrets = any(f.type == "secret" for f in self.config_fields)
+        self.choice_label = f"{self.display_name} -- {self.description}"
 
 
 def discover_plugins(plugins_dir: Path | None = None) -> dict[str, list[PluginInfo]]:
     """Scan the plugins directory and collect all PLUGIN_META.
 
     Returns a dict of category -> list of PluginInfo, in presentation order.
+    Results are memoized per process, keyed on the plugin files' paths and
+    mtimes, so repeat calls only stat the tree; callers get fresh dict/list
+    containers over the shared PluginInfo objects.
     """
     if plugins_dir is None:
         plugins_dir = Path(__file__).parent.parent / "plugins"
-
+    plugins_dir = plugins_dir.resolve()
+    files = _scan_plugin_files(plugins_dir)
+    stamp = tuple((entry.path, entry.stat().st_mtime_ns) for entry in files)
+    discovered = _discover_plugins_cached(plugins_dir, stamp)
+    return {category: list(plugins) for category, plugins in discovered.items()}
+
+
+def invalidate_plugin_cache() -> None:
+    """Drop memoized discover_plugins() results (the on-disk meta cache is kept)."""
+    _discover_plugins_cached.cache_clear()
+
+
+def _scan_plugin_files(plugins_dir: Path) -> list[os.DirEntry]:
+    """Plugin source files under plugins/<category>/, in presentation order."""
+    # scandir reuses dirent types, no extra stats
+    with os.scandir(plugins_dir) as it:
+        subdirs = sorted(
+            (e for e in it if not e.name.startswith("_") and e.is_dir()),
+            key=lambda e: e.name,
+        )
+
+    files: list[os.DirEntry] = []
+    for subdir in subdirs:
+        with os.scandir(subdir.path) as it:
+            files.extend(sorted(
+                (
+                    e for e in it
+                    if e.name.endswith(".py")
+                    and not e.name.startswith("_")
+                    and e.is_file()
+                ),
+                key=lambda e: e.name,
+            ))
+    return files
+
+
+@functools.lru_cache(maxsize=4)
+def _discover_plugins_cached(
+    plugins_dir: Path,
+    stamp: tuple[tuple[str, int], ...],
+) -> dict[str, list[PluginInfo]]:
     results: dict[str, list[PluginInfo]] = {cat: [] for cat in CATEGORY_ORDER}
+    cache_path = _plugin_cache_path()
+    cache = _read_plugin_cache(cache_path)
+    cache_before = dict(cache)
 
-    # Walk all subdirectories of plugins/
-    for subdir in sorted(plugins_dir.iterdir()):
-        if not subdir.is_dir() or subdir.name.startswith("_"):
-            continue
-
-        for filepath in sorted(subdir.glob("*.py")):
-            if filepath.name.startswith("_"):
-                continue
+    for path, _mtime_ns in stamp:
+        plugin = _load_plugin_meta(Path(path), plugins_dir, cache)
+        if plugin:
+            category = plugin.category
+            if category not in results:
+                results[category] = []
+            results[category].append(plugin)
 
-            plugin = _load_plugin_meta(filepath, plugins_dir)
-            if plugin:
-                category = plugin.category
-                if category not in results:
-                    results[category] = []
-                results[category].append(plugin)
+    if cache != cache_before:
+        _write_plugin_cache(cache_path, cache)
 
     # Remove empty categories
     return {k: v for k, v in results.items() if v}
 
 
-def _load_plugin_meta(filepath: Path, plugins_root: Path) -> PluginInfo | None:
-    """Extract PLUGIN_META from source (preferred) or module import (fallback)."""
+def _load_plugin_meta(
+    filepath: Path,
+    plugins_root: Path,
+    cache: dict[str, Any] | None = None,
+) -> PluginInfo | None:
+    """Extract PLUGIN_META from cache, source (preferred) or module import (fallback).
+
+    When a cache dict is given, entries are keyed by file path and reused
+    while the file's mtime and size are unchanged; misses update it in place.
+    """
     # Build module path: plugins/integrations/telegram.py -> plugins.integrations.telegram
     relative = filepath.relative_to(plugins_root.parent)
     module_path = str(relative.with_suffix("")).replace("/", ".").replace("\\", ".")
 
-    meta = _extract_plugin_meta_from_source(filepath)
-    if meta is None:
+    cache_key = str(filepath)
+    stamp: list[int] | None = None
+    if cache is not None:
         try:
-            module = importlib.import_module(module_path)
-            meta = getattr(module, "PLUGIN_META", None)
-        except Exception:
-            logger.debug("Could not import %s", module_path)
-            return None
-        if not meta or not isinstance(meta, dict):
-            return None
+            st = filepath.stat()
+            stamp = [st.st_mtime_ns, st.st_size]
+        except OSError:
+            stamp = None
+
+    entry = cache.get(cache_key) if cache is not None and stamp is not None else None
+    if isinstance(entry, dict) and entry.get("stamp") == stamp:
+        meta = entry.get("meta")
+    else:
+        meta = _read_plugin_meta(filepath, module_path)
+        if cache is not None and stamp is not None and _is_json_safe(meta):
+            cache[cache_key] = {"stamp": stamp, "meta": meta}
+
+    if not meta or not isinstance(meta, dict):
+        return None
 
     # Parse config fields
     config_fields = []
@@ -167,31 +227,106 @@ def _load_plugin_meta(filepath: Path, plugins_root: Path) -> PluginInfo | None:
     )
 
 
-def _extract_plugin_meta_from_source(filepath: Path) -> dict[str, Any] | None:
-    """Parse module source and literal-evaluate PLUGIN_META without importing."""
+def _read_plugin_meta(filepath: Path, module_path: str) -> dict[str, Any] | None:
+    try:
+        source = filepath.read_bytes()
+    except OSError:
+        return None
+    # Files that never mention PLUGIN_META are helpers, not plugins: skip the
+    # parse and never import them.
+    if b"PLUGIN_META" not in source:
+        return None
+
+    found, meta = _extract_plugin_meta_from_source(source, filepath)
+    if meta is not None:
+        return meta
+    if not found:
+        return None
+
+    # PLUGIN_META exists but is not a pure literal; importing is the only way.
     try:
-        source = filepath.read_text(encoding="utf-8")
+        module = importlib.import_module(module_path)
+        meta = getattr(module, "PLUGIN_META", None)
     except Exception:
+        logger.debug("Could not import %s", module_path)
         return None
+    return meta if isinstance(meta, dict) else None
 
+
+def _plugin_cache_path() -> Path:
+    home = Path(os.environ.get("CLAWQUANT_HOME", Path.home() / ".clawquant")).expanduser()
+    return home / PLUGIN_CACHE_FILENAME
+
+
+def _read_plugin_cache(path: Path) -> dict[str, Any]:
+    try:
+        with open(path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _write_plugin_cache(path: Path, cache: dict[str, Any]) -> None:
+    """Best-effort atomic write; a missing home dir just disables caching."""
+    if not path.parent.is_dir():
+        return
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        tmp.write_text(json.dumps(cache))
+        os.replace(tmp, path)
+    except OSError:
+        logger.debug("Could not write plugin cache %s", path)
+
+
+def _is_json_safe(value: Any) -> bool:
+    try:
+        json.dumps(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _extract_plugin_meta_from_source(source: bytes, filepath: Path) -> tuple[bool, dict[str, Any] | None]:
+    """Parse module source and literal-evaluate PLUGIN_META without importing.
+
+    Returns (found, meta): found is True when a top-level PLUGIN_META
+    assignment exists, meta is None when it could not be literal-evaluated.
+    """
     try:
         module_ast = ast.parse(source, filename=str(filepath))
-    except SyntaxError:
-        return None
+    except (SyntaxError, ValueError):
+        return True, None
 
     for node in module_ast.body:
-        if not isinstance(node, ast.Assign):
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets = [node.target]
+        else:
             continue
-        for target in node.targets:
+        for target in targets:
             if isinstance(target, ast.Name) and target.id == "PLUGIN_META":
                 try:
                     value = ast.literal_eval(node.value)
                 except Exception:
-                    return None
+                    return True, None
                 if isinstance(value, dict):
-                    return value
-                return None
-    return None
+                    return True, value
+                return True, None
+    return False, None
+
+
+def partition_by_auto_enable(
+    by_category: dict[str, list[PluginInfo]],
+) -> dict[str, tuple[list[PluginInfo], list[PluginInfo]]]:
+    """Split each category's plugins into (auto_enable, opt-in) lists, preserving order."""
+    out: dict[str, tuple[list[PluginInfo], list[PluginInfo]]] = {}
+    for category, plugins in by_category.items():
+        auto = [p for p in plugins if p.auto_enable]
+        optional = [p for p in plugins if not p.auto_enable]
+        out[category] = (auto, optional)
+    return out
 
 
 def list_all_plugins(plugins_dir: Path | None = None) -> list[PluginInfo]:
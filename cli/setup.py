@@ -7,16 +7,12 @@ plugin file automatically makes it appear in the wizard.
 
 from __future__ import annotations
 
-import importlib
+import functools
+import re
 import subprocess
 import sys
 from pathlib import Path
-from typing import Any
-
-import questionary
-import yaml
-from dotenv import dotenv_values
-from questionary import Choice
+from typing import TYPE_CHECKING, Any, Callable
 
 from cli.banner import print_banner
 from cli.config_gen import _add_plugin_to_config, generate_config
@@ -26,22 +22,50 @@ from cli.scanner import (
     ConfigField,
     PluginInfo,
     discover_plugins,
+    partition_by_auto_enable,
 )
 
-# Questionary style
-STYLE = questionary.Style([
-    ("qmark", "fg:cyan bold"),
-    ("question", "fg:white bold"),
-    ("answer", "fg:green"),
-    ("pointer", "fg:cyan bold"),
-    ("highlighted", "fg:cyan bold"),
-    ("selected", "fg:green"),
-    ("instruction", "fg:gray italic"),
-])
+if TYPE_CHECKING:
+    import questionary
+
+# questionary (and prompt_toolkit beneath it), yaml and importlib are imported
+# inside the functions that use them so non-interactive commands stay fast.
+
+
+@functools.cache
+def _style() -> questionary.Style:
+    """Questionary style, built on first interactive prompt."""
+    import questionary
+
+    return questionary.Style([
+        ("qmark", "fg:cyan bold"),
+        ("question", "fg:white bold"),
+        ("answer", "fg:green"),
+        ("pointer", "fg:cyan bold"),
+        ("highlighted", "fg:cyan bold"),
+        ("selected", "fg:green"),
+        ("instruction", "fg:gray italic"),
+    ])
+
+
+def _yaml_safe_loader() -> type:
+    """libyaml's CSafeLoader when available, else the pure-Python SafeLoader."""
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _yaml_safe_dumper() -> type:
+    """libyaml's CSafeDumper when available, else the pure-Python SafeDumper."""
+    import yaml
+
+    return getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 
 def run_setup(home_dir: Path | None = None) -> None:
     """Run the full interactive setup wizard."""
+    import questionary
+
     print_banner()
     print("  Welcome to ClawQuant setup!\n")
 
@@ -51,7 +75,7 @@ def run_setup(home_dir: Path | None = None) -> None:
         home_str = questionary.text(
             "Where should ClawQuant store its data?",
             default=default_home,
-            style=STYLE,
+            style=_style(),
         ).ask()
         if home_str is None:
             _abort()
@@ -59,22 +83,32 @@ def run_setup(home_dir: Path | None = None) -> None:
     home_dir = home_dir.expanduser()
 
     first_setup = not (home_dir / "config.yaml").exists()
-    existing_auto_update, existing_install_commit = _load_existing_update_settings(home_dir)
+    # Only the small `updates:` block is needed for the first prompt; the full
+    # config is parsed afterwards unless the header peek could not find it.
+    existing_config: dict[str, Any] | None = None
+    update_settings = _peek_update_settings(home_dir)
+    if update_settings is None:
+        existing_config = _load_config(home_dir)
+        update_settings = _load_existing_update_settings(existing_config)
+    existing_auto_update, existing_install_commit = update_settings
     install_commit = existing_install_commit or _detect_install_commit()
 
     auto_update_default = True if first_setup else existing_auto_update
     auto_update = questionary.confirm(
         "Enable automatic updates on startup? (runs `git pull` before `clawquant start`)",
         default=auto_update_default,
-        style=STYLE,
+        style=_style(),
     ).ask()
     if auto_update is None:
         _abort()
 
     # Step 2: Discover all available plugins
+    if existing_config is None:
+        existing_config = _load_config(home_dir)
     all_plugins = discover_plugins()
-    existing_values = _load_existing_plugin_values(home_dir, all_plugins)
-    existing_enabled = _load_existing_enabled_plugins(home_dir)
+    existing_sections = _config_sections(existing_config)
+    existing_values = _load_existing_plugin_values(existing_sections, _load_env(home_dir), all_plugins)
+    existing_enabled = _load_existing_enabled_plugins(existing_sections)
 
     # Step 3: Let user select plugins by category
     enabled_plugins: list[PluginInfo] = []
@@ -85,42 +119,27 @@ def run_setup(home_dir: Path | None = None) -> None:
     # Categories that are auto-enabled by default (unless plugin marks auto_enable=false)
     auto_enabled = ["agent", "risk_rule", "task_handler"]
 
+    partitioned = partition_by_auto_enable(all_plugins)
     for category in CATEGORY_ORDER:
-        plugins = all_plugins.get(category, [])
-        if not plugins:
+        if category not in partitioned:
             continue
+        auto_candidates, optional_plugins = partitioned[category]
+        existing = existing_enabled.get(category, set())
 
         if category in selectable:
-            selected = _select_plugins(
-                category,
-                plugins,
-                existing_enabled.get(category, set()),
-            )
+            selected = _select_plugins(category, all_plugins[category], existing)
             enabled_plugins.extend(selected)
         elif category in auto_enabled:
-            existing = existing_enabled.get(category, set())
-            has_existing = len(existing) > 0
-
             # Auto-enable plugins marked auto_enable=true.
             # If config already exists, honor existing enabled state.
-            auto_plugins: list[PluginInfo] = []
-            optional_plugins: list[PluginInfo] = []
-            for plugin in plugins:
-                if plugin.auto_enable:
-                    if not has_existing or plugin.name in existing:
-                        auto_plugins.append(plugin)
-                else:
-                    optional_plugins.append(plugin)
-
-            enabled_plugins.extend(auto_plugins)
+            if existing:
+                enabled_plugins.extend(p for p in auto_candidates if p.name in existing)
+            else:
+                enabled_plugins.extend(auto_candidates)
 
             # Optional plugins in auto categories are user-selectable.
             if optional_plugins:
-                selected = _select_plugins(
-                    category,
-                    optional_plugins,
-                    existing_enabled.get(category, set()),
-                )
+                selected = _select_plugins(category, optional_plugins, existing)
                 enabled_plugins.extend(selected)
 
     # Step 4: Configure each selected plugin
@@ -132,7 +151,12 @@ def run_setup(home_dir: Path | None = None) -> None:
         if values is not None:
             plugin_values[plugin.name] = values
 
-    # Step 5: Generate config files
+    # Step 5: Start installing extra pip dependencies so the resolver runs
+    # while the config files are written.
+    extra_deps = sorted({dep for plugin in enabled_plugins for dep in plugin.pip_dependencies})
+    pip_proc = _start_pip_install(extra_deps)
+
+    # Step 6: Generate config files
     print()
     print("  Writing configuration...")
     config_path, env_path = generate_config(
@@ -141,25 +165,14 @@ def run_setup(home_dir: Path | None = None) -> None:
         plugin_values=plugin_values,
         auto_update=bool(auto_update),
         install_commit=install_commit,
+        dumper=_yaml_safe_dumper(),
     )
 
-    # Step 6: Install extra pip dependencies if any
-    extra_deps = set()
-    for plugin in enabled_plugins:
-        extra_deps.update(plugin.pip_dependencies)
-    if extra_deps:
-        print(f"  Installing plugin dependencies: {', '.join(extra_deps)}")
-        import subprocess
-        subprocess.check_call(
-            [sys.executable, "-m", "pip", "install", *extra_deps],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
-
-    # Done
+    # Done: show where things were written before waiting on pip
     print()
     print(f"  Config:   {config_path}")
     print(f"  Secrets:  {env_path}")
+    _finish_pip_install(pip_proc, extra_deps)
     print()
     print("  ClawQuant is ready! Run:")
     print("    clawquant start")
@@ -186,8 +199,9 @@ def run_plugin_setup(plugin_name: str) -> None:
     values = _configure_plugin(plugin)
     if values:
         print(f"\n  Configuration for {plugin.display_name}:")
+        secret_keys = {f.key for f in plugin.config_fields if f.type == "secret"}
         for k, v in values.items():
-            display_v = "********" if any(f.key == k and f.type == "secret" for f in plugin.config_fields) else v
+            display_v = "********" if k in secret_keys else v
             print(f"    {k}: {display_v}")
         print(f"\n  Run 'clawquant config' to apply changes to your configuration.\n")
 
@@ -207,8 +221,10 @@ def enable_plugin_with_setup(plugin_name: str, home_dir: Path | None = None) ->
     home_dir = home_dir.expanduser()
     home_dir.mkdir(parents=True, exist_ok=True)
 
+    config = _load_config(home_dir)
+    existing_env = _load_env(home_dir)
     all_plugins = discover_plugins()
-    existing_values = _load_existing_plugin_values(home_dir, all_plugins)
+    existing_values = _load_existing_plugin_values(_config_sections(config), existing_env, all_plugins)
     current_values = existing_values.get(plugin.name, {})
 
     print_banner()
@@ -224,42 +240,29 @@ def enable_plugin_with_setup(plugin_name: str, home_dir: Path | None = None) ->
     config_path = home_dir / "config.yaml"
     env_path = home_dir / ".env"
 
-    config: dict[str, Any] = {}
-    if config_path.exists():
-        with open(config_path) as f:
-            config = yaml.safe_load(f) or {}
-
     secrets: dict[str, str] = {}
     _add_plugin_to_config(config, secrets, plugin, values)
     _ensure_plugin_enabled(config, plugin)
 
-    with open(config_path, "w") as f:
-        f.write("# ClawQuant Configuration\n")
-        f.write("# Updated by clawquant plugin enable\n\n")
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    import yaml
 
-    existing_env = dotenv_values(env_path) if env_path.exists() else {}
-    env_out: dict[str, str] = {
-        str(k): str(v)
-        for k, v in existing_env.items()
-        if k and v is not None
-    }
+    config_path.write_text(
+        "# ClawQuant Configuration\n"
+        "# Updated by clawquant plugin enable\n\n"
+        + yaml.dump(config, Dumper=_yaml_safe_dumper(), default_flow_style=False, sort_keys=False, allow_unicode=True)
+    )
+
+    env_out: dict[str, str] = dict(existing_env)
     env_out.update(secrets)
-    with open(env_path, "w") as f:
-        f.write("# ClawQuant Secrets\n")
-        f.write("# Updated by clawquant plugin enable\n")
-        f.write("# NEVER commit this file to git\n\n")
-        for key in sorted(env_out):
-            f.write(f"{key}={env_out[key]}\n")
-
-    if plugin.pip_dependencies:
-        print(f"  Installing plugin dependencies: {', '.join(plugin.pip_dependencies)}")
-        import subprocess
-        subprocess.check_call(
-            [sys.executable, "-m", "pip", "install", *plugin.pip_dependencies],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
+    env_path.write_text(
+        "# ClawQuant Secrets\n"
+        "# Updated by clawquant plugin enable\n"
+        "# NEVER commit this file to git\n\n"
+        + "".join(f"{key}={env_out[key]}\n" for key in sorted(env_out))
+    )
+
+    deps = list(dict.fromkeys(plugin.pip_dependencies))
+    _finish_pip_install(_start_pip_install(deps), deps)
 
     print()
     print(f"  Enabled: {plugin.name}")
@@ -279,6 +282,9 @@ def _select_plugins(
     existing_enabled_names: set[str] | None = None,
 ) -> list[PluginInfo]:
     """Show a checkbox list for selecting plugins in a category."""
+    import questionary
+    from questionary import Choice
+
     label = CATEGORY_LABELS.get(category, category)
     required = category == "ai_provider"
     existing_enabled_names = existing_enabled_names or set()
@@ -299,7 +305,7 @@ def _select_plugins(
         selected = questionary.checkbox(
             f"Select {label}:",
             choices=choices,
-            style=STYLE,
+            style=_style(),
             instruction=(
                 "(use SPACE to select, ENTER to confirm)"
                 + (" (leave empty to keep current)" if required and existing_enabled_names else "")
@@ -320,6 +326,9 @@ def _select_plugins(
 
 def _configure_plugin(plugin: PluginInfo, existing: dict[str, Any] | None = None) -> dict[str, Any] | None:
     """Walk through a plugin's config fields and collect values."""
+    import questionary
+    from questionary import Choice
+
     if not plugin.config_fields:
         return {}
     existing = existing or {}
@@ -346,7 +355,7 @@ def _configure_plugin(plugin: PluginInfo, existing: dict[str, Any] | None = None
             Choice("Skip (keep current values)", value="skip"),
         ],
         default="skip" if can_skip else "configure",
-        style=STYLE,
+        style=_style(),
     ).ask()
     if action is None:
         _abort()
@@ -379,81 +388,107 @@ def _configure_plugin(plugin: PluginInfo, existing: dict[str, Any] | None = None
 
 def _prompt_field(field: ConfigField, plugin_name: str, current: Any = None) -> Any:
     """Prompt for a single config field based on its type."""
-    label = field.label
-    if field.description:
-        label = f"{field.label} ({field.description})"
-
     default = current if _has_value(current) else field.default
+    handler = _FIELD_PROMPTS.get(field.type, _prompt_string)
+    return handler(field, current, default)
+
+
+def _prompt_secret(field: ConfigField, current: Any, default: Any) -> Any:
+    import questionary
+
+    value = questionary.password(
+        f"{field.label}{' (leave blank to keep current)' if _has_value(current) else ''}:",
+        style=_style(),
+    ).ask()
+    if value is None:
+        _abort()
+    if value == "" and _has_value(current):
+        return None
+    return value
+
+
+def _prompt_choice(field: ConfigField, current: Any, default: Any) -> Any:
+    import questionary
+
+    value = questionary.select(
+        f"{field.label}:",
+        choices=field.choices,
+        default=default,
+        style=_style(),
+    ).ask()
+    if value is None:
+        _abort()
+    return value
 
-    match field.type:
-        case "secret":
-            value = questionary.password(
-                f"{field.label}{' (leave blank to keep current)' if _has_value(current) else ''}:",
-                style=STYLE,
-            ).ask()
-            if value is None:
-                _abort()
-            if value == "" and _has_value(current):
-                return None
-            return value
-
-        case "choice":
-            value = questionary.select(
-                f"{field.label}:",
-                choices=field.choices,
-                default=default,
-                style=STYLE,
-            ).ask()
-            if value is None:
-                _abort()
-            return value
-
-        case "boolean":
-            value = questionary.confirm(
-                f"{field.label}?",
-                default=bool(default) if default is not None else True,
-                style=STYLE,
-            ).ask()
-            if value is None:
-                _abort()
-            return value
-
-        case "number":
-            default_str = str(default) if default is not None else ""
-            value = questionary.text(
-                f"{field.label}:",
-                default=default_str,
-                style=STYLE,
-            ).ask()
-            if value is None:
-                _abort()
-            try:
-                num = float(value)
-                return int(num) if num == int(num) else num
-            except ValueError:
-                return default
-
-        case "list":
-            default_str = ", ".join(default) if isinstance(default, list) else str(default or "")
-            value = questionary.text(
-                f"{field.label} (comma-separated):",
-                default=default_str,
-                style=STYLE,
-            ).ask()
-            if value is None:
-                _abort()
-            return [item.strip() for item in value.split(",") if item.strip()]
-
-        case _:  # string
-            default_str = str(default) if default is not None else ""
-            value = questionary.text(
-                f"{field.label}:",
-                default=default_str,
-                style=STYLE,
-            ).ask()
-            if value is None:
-                _abort()
-            return value
+
+def _prompt_boolean(field: ConfigField, current: Any, default: Any) -> Any:
+    import questionary
+
+    value = questionary.confirm(
+        f"{field.label}?",
+        default=bool(default) if default is not None else True,
+        style=_style(),
+    ).ask()
+    if value is None:
+        _abort()
+    return value
+
+
+def _prompt_number(field: ConfigField, current: Any, default: Any) -> Any:
+    import questionary
+
+    default_str = str(default) if default is not None else ""
+    value = questionary.text(
+        f"{field.label}:",
+        default=default_str,
+        style=_style(),
+    ).ask()
+    if value is None:
+        _abort()
+    try:
+        num = float(value)
+        return int(num) if num == int(num) else num
+    except ValueError:
+        return default
+
+
+def _prompt_list(field: ConfigField, current: Any, default: Any) -> Any:
+    import questionary
+
+    default_str = ", ".join(default) if isinstance(default, list) else str(default or "")
+    value = questionary.text(
+        f"{field.label} (comma-separated):",
+        default=default_str,
+        style=_style(),
+    ).ask()
+    if value is None:
+        _abort()
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _prompt_string(field: ConfigField, current: Any, default: Any) -> Any:
+    import questionary
+
+    default_str = str(default) if default is not None else ""
+    value = questionary.text(
+        f"{field.label}:",
+        default=default_str,
+        style=_style(),
+    ).ask()
+    if value is None:
+        _abort()
+    return value
+
+
+# ConfigField.type -> prompt(field, current, default); unknown types prompt as strings.
+_FIELD_PROMPTS: dict[str, Callable[[ConfigField, Any, Any], Any]] = {
+    "secret": _prompt_secret,
+    "choice": _prompt_choice,
+    "boolean": _prompt_boolean,
+    "number": _prompt_number,
+    "list": _prompt_list,
+    "string": _prompt_string,
+}
 
 
 def _run_plugin_setup_hook(
@@ -462,6 +497,8 @@ def _run_plugin_setup_hook(
     values: dict[str, Any],
 ) -> dict[str, Any]:
     """Run optional plugin-defined setup hook and return extra field values."""
+    import importlib
+
     hook_name = plugin.setup_hook
     if not hook_name:
         return {}
@@ -481,7 +518,7 @@ def _run_plugin_setup_hook(
         result = hook(
             existing_values=dict(existing),
             current_values=dict(values),
-            style=STYLE,
+            style=_style(),
             abort_fn=_abort,
         )
     except TypeError:
@@ -508,6 +545,82 @@ def _run_plugin_setup_hook(
     return {}
 
 
+# A requirement that is only a distribution name (no version, extras or markers).
+_BARE_REQUIREMENT_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
+
+
+def _normalize_dist_name(name: str) -> str:
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _missing_deps(deps: list[str]) -> list[str]:
+    """Drop bare-name deps that are already installed; anything pinned goes to pip."""
+    if not deps:
+        return []
+    from importlib import metadata
+
+    installed = {
+        _normalize_dist_name(dist.metadata["Name"] or "")
+        for dist in metadata.distributions()
+    }
+    return [
+        dep for dep in deps
+        if not (_BARE_REQUIREMENT_RE.match(dep) and _normalize_dist_name(dep) in installed)
+    ]
+
+
+def _start_pip_install(deps: list[str]) -> subprocess.Popen | None:
+    """Spawn one background `pip install` for missing deps; None when there are none."""
+    deps = _missing_deps(deps)
+    if not deps:
+        return None
+    print(f"  Installing plugin dependencies: {', '.join(deps)}")
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "pip", "install",
+            "--disable-pip-version-check", "--no-input", "--quiet",
+            *deps,
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+
+
+_SPINNER_FRAMES = "|/-\\"
+
+
+def _finish_pip_install(proc: subprocess.Popen | None, deps: list[str]) -> None:
+    """Wait for a pip install started by _start_pip_install, with a spinner on a TTY.
+
+    pip's output is collected while waiting and shown only if it fails.
+    """
+    if proc is None:
+        return
+    spin = sys.stdout.isatty()
+    frame = 0
+    while True:
+        try:
+            # communicate() keeps draining the pipe across timeouts.
+            output, _ = proc.communicate(timeout=0.1)
+            break
+        except subprocess.TimeoutExpired:
+            if spin:
+                sys.stdout.write(f"\r  Waiting for pip... {_SPINNER_FRAMES[frame % len(_SPINNER_FRAMES)]}")
+                sys.stdout.flush()
+                frame += 1
+    if spin and frame:
+        sys.stdout.write("\r" + " " * 40 + "\r")
+        sys.stdout.flush()
+
+    if proc.returncode != 0:
+        print("  Warning: Failed to install plugin dependencies.")
+        for line in (output or "").strip().splitlines():
+            print(f"    {line}")
+        print(f"  Run: pip install {' '.join(deps)}")
+
+
 def _abort() -> None:
     """User pressed Ctrl+C or cancelled."""
     print("\n  Setup cancelled.\n")
@@ -524,21 +637,60 @@ def _has_value(value: Any) -> bool:
     return True
 
 
-def _load_existing_plugin_values(
-    home_dir: Path,
-    all_plugins: dict[str, list[PluginInfo]],
-) -> dict[str, dict[str, Any]]:
-    """Load existing config/env and map values per plugin."""
+def _load_config(home_dir: Path) -> dict[str, Any]:
+    """Parse config.yaml once per wizard run; {} when it does not exist yet."""
+    import yaml
+
     config_path = home_dir / "config.yaml"
-    env_path = home_dir / ".env"
+    if not config_path.exists():
+        return {}
+    with open(config_path) as f:
+        config = yaml.load(f, Loader=_yaml_safe_loader()) or {}
+    return config if isinstance(config, dict) else {}
 
-    config: dict[str, Any] = {}
-    if config_path.exists():
-        with open(config_path) as f:
-            config = yaml.safe_load(f) or {}
 
-    env = dotenv_values(env_path) if env_path.exists() else {}
+def _load_env(home_dir: Path) -> dict[str, str]:
+    """Read the .env secrets file once per wizard run; {} when absent."""
+    return _read_env(home_dir / ".env")
+
+
+def _read_env(path: Path) -> dict[str, str]:
+    """Parse the KEY=VALUE .env format written by the wizard.
+
+    Also tolerates hand edits: `export` prefixes, one layer of matching
+    quotes, and ` #` comments after unquoted values. No interpolation.
+    """
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return {}
 
+    env: dict[str, str] = {}
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("export "):
+            line = line[7:].lstrip()
+        key, sep, value = line.partition("=")
+        key = key.strip()
+        if not sep or not key:
+            continue
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        else:
+            value = value.split(" #", 1)[0].rstrip()
+        env[key] = value
+    return env
+
+
+def _load_existing_plugin_values(
+    sections: dict[str, dict[str, Any]],
+    env: dict[str, str],
+    all_plugins: dict[str, list[PluginInfo]],
+) -> dict[str, dict[str, Any]]:
+    """Map existing config/env values per plugin."""
     by_name: dict[str, PluginInfo] = {
         p.name: p
         for plugins in all_plugins.values()
@@ -547,7 +699,7 @@ def _load_existing_plugin_values(
 
     out: dict[str, dict[str, Any]] = {}
     for name, plugin in by_name.items():
-        vals = _read_plugin_values_from_config(config, plugin)
+        vals = _read_plugin_values_from_config(sections, plugin)
         # Resolve secret placeholders from .env
         for field in plugin.config_fields:
             if field.type == "secret" and field.env_var:
@@ -558,30 +710,43 @@ def _load_existing_plugin_values(
     return out
 
 
-def _read_plugin_values_from_config(config: dict[str, Any], plugin: PluginInfo) -> dict[str, Any]:
-    """Extract existing values for a plugin from config.yaml shape."""
-    values: dict[str, Any] = {}
-    category = plugin.category
-
-    if category == "ai_provider":
-        values = (((config.get("ai") or {}).get("providers") or {}).get(plugin.name) or {}).copy()
-    elif category == "market_data":
-        values = (((config.get("market_data") or {}).get("providers") or {}).get(plugin.name) or {}).copy()
-    elif category == "integration":
-        integ = ((config.get("integrations") or {}).get(plugin.name) or {}).copy()
-        channels = integ.get("channels") or []
+# Plugin category -> key path of the config.yaml section holding its entries.
+_CATEGORY_SECTION_PATHS: dict[str, tuple[str, ...]] = {
+    "ai_provider": ("ai", "providers"),
+    "market_data": ("market_data", "providers"),
+    "integration": ("integrations",),
+    "agent": ("ai", "agents"),
+    "risk_rule": ("risk", "rules"),
+    "task_handler": ("scheduler", "handlers"),
+}
+
+
+def _config_sections(config: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Resolve each category's config section once (plain references, not copies)."""
+    sections: dict[str, dict[str, Any]] = {}
+    for category, path in _CATEGORY_SECTION_PATHS.items():
+        node: Any = config
+        for key in path:
+            node = (node.get(key) if isinstance(node, dict) else None) or {}
+        sections[category] = node if isinstance(node, dict) else {}
+    return sections
+
+
+def _read_plugin_values_from_config(
+    sections: dict[str, dict[str, Any]],
+    plugin: PluginInfo,
+) -> dict[str, Any]:
+    """Extract existing values for a plugin from its category's config section."""
+    entry = sections.get(plugin.category, {}).get(plugin.name)
+    values: dict[str, Any] = entry.copy() if isinstance(entry, dict) else {}
+
+    if plugin.category == "integration":
+        channels = values.get("channels") or []
         if channels and isinstance(channels, list):
             first = channels[0] or {}
             for key in ("chat_id", "direction"):
                 if key in first:
-                    integ[key] = first[key]
-        values = integ
-    elif category == "risk_rule":
-        values = (((config.get("risk") or {}).get("rules") or {}).get(plugin.name) or {}).copy()
-    elif category == "task_handler":
-        values = (((config.get("scheduler") or {}).get("handlers") or {}).get(plugin.name) or {}).copy()
-    elif category == "agent":
-        values = (((config.get("ai") or {}).get("agents") or {}).get(plugin.name) or {}).copy()
+                    values[key] = first[key]
 
     # Strip generic keys that are not direct field values
     values.pop("enabled", None)
@@ -589,47 +754,20 @@ def _read_plugin_values_from_config(config: dict[str, Any], plugin: PluginInfo)
     return values
 
 
-def _load_existing_enabled_plugins(home_dir: Path) -> dict[str, set[str]]:
-    """Load currently enabled plugin names by category."""
-    config_path = home_dir / "config.yaml"
-    config: dict[str, Any] = {}
-    if config_path.exists():
-        with open(config_path) as f:
-            config = yaml.safe_load(f) or {}
-
+def _load_existing_enabled_plugins(sections: dict[str, dict[str, Any]]) -> dict[str, set[str]]:
+    """Collect currently enabled plugin names by category."""
     out: dict[str, set[str]] = {category: set() for category in CATEGORY_ORDER}
+    for category, entries in sections.items():
+        out[category] = {
+            name
+            for name, cfg in entries.items()
+            if not isinstance(cfg, dict) or cfg.get("enabled", True)
+        }
+    return out
 
-    ai_providers = ((config.get("ai") or {}).get("providers") or {})
-    for name, cfg in ai_providers.items():
-        if not isinstance(cfg, dict) or cfg.get("enabled", True):
-            out["ai_provider"].add(name)
-
-    md_providers = ((config.get("market_data") or {}).get("providers") or {})
-    for name, cfg in md_providers.items():
-        if not isinstance(cfg, dict) or cfg.get("enabled", True):
-            out["market_data"].add(name)
-
-    integrations = config.get("integrations") or {}
-    for name, cfg in integrations.items():
-        if not isinstance(cfg, dict) or cfg.get("enabled", True):
-            out["integration"].add(name)
-
-    agents = ((config.get("ai") or {}).get("agents") or {})
-    for name, cfg in agents.items():
-        if not isinstance(cfg, dict) or cfg.get("enabled", True):
-            out["agent"].add(name)
-
-    rules = ((config.get("risk") or {}).get("rules") or {})
-    for name, cfg in rules.items():
-        if not isinstance(cfg, dict) or cfg.get("enabled", True):
-            out["risk_rule"].add(name)
 
-    handlers = ((config.get("scheduler") or {}).get("handlers") or {})
-    for name, cfg in handlers.items():
-        if not isinstance(cfg, dict) or cfg.get("enabled", True):
-            out["task_handler"].add(name)
-
-    return out
+_TRUE_STRINGS = frozenset({"1", "true", "yes", "on"})
+_FALSE_STRINGS = frozenset({"0", "false", "no", "off"})
 
 
 def _parse_bool(value: Any, default: bool = False) -> bool:
@@ -639,26 +777,16 @@ def _parse_bool(value: Any, default: bool = False) -> bool:
         return value
     if isinstance(value, (int, float)):
         return bool(value)
-    lowered = str(value).strip().lower()
-    if lowered in {"1", "true", "yes", "on"}:
+    lowered = (value if isinstance(value, str) else str(value)).strip().lower()
+    if lowered in _TRUE_STRINGS:
         return True
-    if lowered in {"0", "false", "no", "off"}:
+    if lowered in _FALSE_STRINGS:
         return False
     return default
 
 
-def _load_existing_update_settings(home_dir: Path) -> tuple[bool, str]:
-    """Read existing updates settings from config if present."""
-    config_path = home_dir / "config.yaml"
-    if not config_path.exists():
-        return False, ""
-
-    try:
-        with open(config_path) as f:
-            config = yaml.safe_load(f) or {}
-    except Exception:
-        return False, ""
-
+def _load_existing_update_settings(config: dict[str, Any]) -> tuple[bool, str]:
+    """Read existing updates settings from a parsed config."""
     updates = config.get("updates")
     if not isinstance(updates, dict):
         return False, ""
@@ -668,34 +796,80 @@ def _load_existing_update_settings(home_dir: Path) -> tuple[bool, str]:
     return auto_update, install_commit
 
 
-def _detect_install_commit() -> str:
-    """Try to detect the current install commit hash."""
-    repo_root = Path(__file__).resolve().parent.parent
+# Top-level `updates:` mapping block (indented lines until the next top-level key).
+_UPDATES_BLOCK_RE = re.compile(r"^updates:[ \t]*\n(?:(?:[ \t]+.*|[ \t]*)(?:\n|$))*", re.MULTILINE)
+_UPDATES_PEEK_BYTES = 4096
 
-    meta_path = repo_root / ".clawquant-install-meta"
-    if meta_path.exists():
-        try:
-            for line in meta_path.read_text(encoding="utf-8").splitlines():
-                if line.startswith("commit="):
-                    commit = line.split("=", 1)[1].strip()
-                    if commit:
-                        return commit
-        except Exception:
-            pass
 
+def _peek_update_settings(home_dir: Path) -> tuple[bool, str] | None:
+    """Read update settings from the head of config.yaml without a full parse.
+
+    Generated configs place `updates:` near the top. Returns None when the
+    block is not found in the first few KB so the caller can fully parse.
+    """
+    import yaml
+
+    config_path = home_dir / "config.yaml"
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=repo_root,
-            capture_output=True,
-            text=True,
-        )
-    except Exception:
-        return ""
+        with open(config_path) as f:
+            head = f.read(_UPDATES_PEEK_BYTES)
+    except FileNotFoundError:
+        return False, ""
+    except OSError:
+        return None
+
+    match = _UPDATES_BLOCK_RE.search(head)
+    if match is None or match.end() == len(head):
+        # Missing, or possibly truncated by the read window.
+        return None
+    try:
+        block = yaml.load(match.group(0), Loader=_yaml_safe_loader())
+    except yaml.YAMLError:
+        return None
+    if not isinstance(block, dict):
+        return None
+    return _load_existing_update_settings(block)
+
 
-    if result.returncode != 0:
-        return ""
-    return result.stdout.strip()
+def _read_key_values(path: Path) -> dict[str, str]:
+    """Parse a ``key=value`` per line file; {} when missing or unreadable."""
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return {}
+    return {key.strip(): value.strip() for key, sep, value in (line.partition("=") for line in lines) if sep}
+
+
+def _detect_install_commit() -> str:
+    """Try to detect the current install commit hash.
+
+    Reuses the commit cached in .clawquant-install-cache while the HEAD
+    stamp stored with it still matches .git; otherwise resolves HEAD
+    (reading .git directly before falling back to git) and caches both.
+    The installer's .clawquant-install-meta is only read, as a last resort.
+    """
+    from cli.gitinfo import current_repo_commit, repo_head_stamp
+
+    repo_root = Path(__file__).resolve().parent.parent
+    cache_path = repo_root / ".clawquant-install-cache"
+    stamp = repo_head_stamp(repo_root)
+
+    cached = _read_key_values(cache_path)
+    commit = cached.get("commit", "")
+    if commit and stamp and cached.get("head_stamp") == stamp:
+        return commit
+
+    current_repo_commit.cache_clear()  # HEAD moved since it was last resolved
+    commit = current_repo_commit(repo_root)
+    if not commit:
+        return _read_key_values(repo_root / ".clawquant-install-meta").get("commit", "")
+    if stamp:
+        cached.update(commit=commit, head_stamp=stamp)
+        try:
+            cache_path.write_text("".join(f"{k}={v}\n" for k, v in cached.items()), encoding="utf-8")
+        except OSError:
+            pass
+    return commit
 
 
 def _ensure_plugin_enabled(config: dict[str, Any], plugin: PluginInfo) -> None:
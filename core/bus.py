@@ -1,7 +1,8 @@
 """AsyncIOBus -- default EventBus implementation using in-process async pub/sub.
 
 Events are dispatched to subscribers via asyncio.create_task() and
-persisted to daily JSONL files for audit.
+persisted to daily JSONL files for audit. Persistence is batched by a
+background writer task that keeps the day's file open.
 """
 
 from __future__ import annotations
@@ -9,16 +10,43 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
+import time
+from collections import deque
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 from typing import Any, Callable, Coroutine
 
 from core.models.events import Event
 
+try:  # optional: faster event serialization straight to UTF-8 bytes
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 Callback = Callable[[Event], Coroutine[Any, Any, None]]
 
+# Audit writer batching: write after this many lines or this many seconds.
+_WRITE_BATCH_MAX = 256
+_WRITE_FLUSH_INTERVAL = 0.05
+_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+# Recent events kept in memory for audit queries (see AsyncIOBus.recent).
+_RECENT_EVENTS_MAX = 1000
+# Written through immediately (with anything queued ahead of them) instead of
+# waiting for the next batch: FrequencyRule counts these from today's file
+# and needs them visible as soon as publish() returns.
+_SYNC_PERSIST_TYPES = frozenset({"signal.approved"})
+
+_NO_SUBSCRIBERS: dict[Callback, bool] = {}
+# UTC datetimes as "...Z", matching pydantic's model_dump_json output.
+_ORJSON_OPTIONS = (
+    orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+    if orjson is not None else 0
+)
+
 
 class AsyncIOBus:
     """In-process async pub/sub event bus with JSONL audit logging.
@@ -32,10 +60,31 @@ class AsyncIOBus:
     """
 
     def __init__(self, events_dir: Path) -> None:
-        self._subscribers: dict[str, list[Callback]] = {}
-        self._wildcard_subscribers: list[Callback] = []
+        # Insertion-ordered callback -> await_completion dicts: O(1) unsubscribe,
+        # stable dispatch order
+        self._subscribers: dict[str, dict[Callback, bool]] = {}
+        self._wildcard_subscribers: dict[Callback, bool] = {}
+        # event type -> (callback, await_completion) pairs, typed then wildcard;
+        # rebuilt lazily after any subscribe/unsubscribe
+        self._dispatch_cache: dict[str, tuple[tuple[Callback, bool], ...]] = {}
+        # Fire-and-forget handler tasks, referenced until done
+        self._detached: set[asyncio.Task[None]] = set()
         self._events_dir = events_dir
         self._events_dir.mkdir(parents=True, exist_ok=True)
+        self._recent: deque[Event] = deque(maxlen=_RECENT_EVENTS_MAX)
+
+        # Background audit writer (started lazily on first publish; needs a loop).
+        # None on the queue is the shutdown sentinel used by aclose().
+        self._write_queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+        self._writer_task: asyncio.Task[None] | None = None
+        # Lines the writer has taken off the queue but not yet written
+        self._write_batch: list[bytes] = []
+        # O_APPEND fd for the current UTC day's file; reopened on rollover.
+        # The day string is only re-formatted when the epoch day changes.
+        self._fd: int | None = None
+        self._fd_date: str | None = None
+        self._day_epoch = -1
+        self._day_str = ""
 
     @property
     def name(self) -> str:
@@ -45,55 +94,78 @@ class AsyncIOBus:
         """Publish an event: persist to audit log, then dispatch to subscribers."""
         # Persist to JSONL audit log
         self._persist(event)
+        self._recent.append(event)
 
-        # Dispatch to type-specific subscribers
-        callbacks = self._subscribers.get(event.type, [])
-
-        # Also dispatch to wildcard subscribers (subscribed to "*")
-        callbacks = callbacks + self._wildcard_subscribers
+        # Dispatch to type-specific subscribers, then wildcard subscribers ("*")
+        entries = self._dispatch_cache.get(event.type)
+        if entries is None:
+            entries = self._dispatch_cache[event.type] = (
+                *self._subscribers.get(event.type, _NO_SUBSCRIBERS).items(),
+                *self._wildcard_subscribers.items(),
+            )
+        total = len(entries)
 
-        if not callbacks:
-            logger.debug("No subscribers for event type: %s", event.type)
+        # Debug logging is off in production; skip the logging call entirely.
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if not total:
+            if debug:
+                logger.debug("No subscribers for event type: %s", event.type)
             return
 
-        logger.debug(
-            "Publishing %s to %d subscriber(s) [correlation=%s]",
-            event.type,
-            len(callbacks),
-            event.correlation_id,
-        )
+        if debug:
+            logger.debug(
+                "Publishing %s to %d subscriber(s) [correlation=%s]",
+                event.type,
+                total,
+                event.correlation_id,
+            )
 
-        # Fire all callbacks concurrently
+        # Fire all callbacks concurrently, each in its own task; don't let
+        # failures propagate. Only handlers subscribed with await_completion=True are waited on.
         tasks = []
-        for cb in callbacks:
-            task = asyncio.create_task(self._safe_invoke(cb, event))
-            tasks.append(task)
-
-        # Wait for all to complete (don't let failures propagate)
+        for cb, await_completion in entries:
+            if await_completion:
+                tasks.append(asyncio.create_task(self._safe_invoke(cb, event)))
+            else:
+                self._detach(cb, event)
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
 
-    def subscribe(self, event_type: str, callback: Callback) -> None:
+    def _detach(self, callback: Callback, event: Event) -> None:
+        task = asyncio.create_task(self._safe_invoke(callback, event))
+        self._detached.add(task)
+        task.add_done_callback(self._detached.discard)
+
+    def subscribe(
+        self,
+        event_type: str,
+        callback: Callback,
+        *,
+        await_completion: bool = True,
+    ) -> None:
         """Register a callback for events of the given type.
 
-        Use event_type="*" to subscribe to all events.
+        Use event_type="*" to subscribe to all events. With
+        await_completion=False the handler is scheduled but publish() does
+        not wait for it (errors are still logged). Subscribing a callback
+        that is already subscribed to event_type only updates its
+        await_completion; it is still called once per event.
         """
         if event_type == "*":
-            self._wildcard_subscribers.append(callback)
+            self._wildcard_subscribers[callback] = await_completion
         else:
-            if event_type not in self._subscribers:
-                self._subscribers[event_type] = []
-            self._subscribers[event_type].append(callback)
-        logger.debug("Subscribed to '%s': %s", event_type, callback)
+            self._subscribers.setdefault(event_type, {})[callback] = await_completion
+        self._dispatch_cache.clear()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Subscribed to '%s': %s", event_type, callback)
 
     def unsubscribe(self, event_type: str, callback: Callback) -> None:
         """Remove a previously registered callback."""
         if event_type == "*":
-            if callback in self._wildcard_subscribers:
-                self._wildcard_subscribers.remove(callback)
-        elif event_type in self._subscribers:
-            if callback in self._subscribers[event_type]:
-                self._subscribers[event_type].remove(callback)
+            self._wildcard_subscribers.pop(callback, None)
+        else:
+            self._subscribers.get(event_type, {}).pop(callback, None)
+        self._dispatch_cache.clear()
 
     async def _safe_invoke(self, callback: Callback, event: Event) -> None:
         """Invoke a callback, catching and logging any exceptions."""
@@ -107,18 +179,128 @@ class AsyncIOBus:
             )
 
     def _persist(self, event: Event) -> None:
-        """Append event to today's JSONL audit file."""
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        filepath = self._events_dir / f"{today}.jsonl"
+        """Queue event for the background JSONL writer (sync write without a loop)."""
+        line = _serialize(event)
+        if event.type in _SYNC_PERSIST_TYPES:
+            self._write_through(line)
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_lines(line)
+            return
+
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = loop.create_task(self._writer_loop())
+        self._write_queue.put_nowait(line)
+
+    def _write_through(self, line: bytes) -> None:
+        """Write line now, after everything still queued or batched, keeping file order."""
+        batch = self._write_batch
+        queue = self._write_queue
+        stop = False
+        while not queue.empty():
+            queued = queue.get_nowait()
+            if queued is None:
+                stop = True
+            else:
+                batch.append(queued)
+        batch.append(line)
+        self._write_lines(b"".join(batch))
+        batch.clear()
+        if stop:
+            queue.put_nowait(None)
+
+    async def _writer_loop(self) -> None:
+        """Drain the write queue, coalescing lines into one write per batch."""
+        queue = self._write_queue
+        loop = asyncio.get_running_loop()
+        batch = self._write_batch  # shared with _write_through
+        while True:
+            line = await queue.get()
+            if line is None:
+                return
+            batch.append(line)
+            stop = False
+            deadline = loop.time() + _WRITE_FLUSH_INTERVAL
+            while len(batch) < _WRITE_BATCH_MAX:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    line = await asyncio.wait_for(queue.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    break
+                if line is None:
+                    stop = True
+                    break
+                batch.append(line)
+            if batch:  # empty if _write_through already flushed it
+                self._write_lines(b"".join(batch))
+                batch.clear()
+            if stop:
+                return
 
-        line = event.model_dump_json() + "\n"
+    def _write_lines(self, data: bytes) -> None:
+        """Append data to today's JSONL audit file, reopening on UTC date rollover."""
+        day = int(time.time()) // 86400
+        if day != self._day_epoch:
+            self._day_epoch = day
+            self._day_str = datetime.fromtimestamp(day * 86400, tz=timezone.utc).strftime("%Y-%m-%d")
+        today = self._day_str
+        filepath = self._events_dir / f"{today}.jsonl"
 
         try:
-            with open(filepath, "a") as f:
-                f.write(line)
+            if self._fd is None or today != self._fd_date:
+                self._close_file()
+                self._fd = os.open(filepath, _OPEN_FLAGS, 0o644)
+                self._fd_date = today
+            view = memoryview(data)
+            while view:
+                view = view[os.write(self._fd, view):]
         except OSError:
             logger.exception("Failed to persist event to %s", filepath)
 
+    def _close_file(self) -> None:
+        if self._fd is None:
+            return
+        try:
+            os.close(self._fd)
+        except OSError:
+            logger.exception("Failed to close event log")
+        self._fd = None
+        self._fd_date = None
+
+    async def aclose(self) -> None:
+        """Wait for detached handlers, flush queued events and close the audit file."""
+        if self._detached:
+            await asyncio.gather(*self._detached, return_exceptions=True)
+
+        task = self._writer_task
+        if task is not None and not task.done():
+            self._write_queue.put_nowait(None)
+            await task
+        self._writer_task = None
+
+        # Anything queued after the writer stopped still gets written.
+        pending = self._write_batch
+        while not self._write_queue.empty():
+            line = self._write_queue.get_nowait()
+            if line is not None:
+                pending.append(line)
+        if pending:
+            self._write_lines(b"".join(pending))
+            pending.clear()
+        self._close_file()
+
+    def recent(self, n: int = 100, event_type: str | None = None) -> list[Event]:
+        """Return up to n most recently published events, newest first."""
+        events = reversed(self._recent)
+        if event_type is not None:
+            events = (e for e in events if e.type == event_type)
+        return list(islice(events, n))
+
     def subscriber_count(self, event_type: str | None = None) -> int:
         """Return the number of subscribers, optionally filtered by event type."""
         if event_type is None:
@@ -126,4 +308,14 @@ class AsyncIOBus:
             return total + len(self._wildcard_subscribers)
         if event_type == "*":
             return len(self._wildcard_subscribers)
-        return len(self._subscribers.get(event_type, []))
+        return len(self._subscribers.get(event_type, ()))
+
+
+def _serialize(event: Event) -> bytes:
+    """Encode an event as one JSONL line (orjson when installed)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(event.model_dump(), default=str, option=_ORJSON_OPTIONS)
+        except TypeError:  # orjson.JSONEncodeError subclasses TypeError
+            pass
+    return event.model_dump_json().encode() + b"\n"
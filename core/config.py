@@ -12,8 +12,6 @@ import re
 from pathlib import Path
 from typing import Any
 
-import yaml
-from dotenv import load_dotenv
 from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
@@ -21,23 +19,42 @@ logger = logging.getLogger(__name__)
 # Default home directory for all state files
 DEFAULT_HOME = Path.home() / ".clawquant"
 
+_ENV_VAR_RE = re.compile(r"\$\{(\w+)\}")
 
-def _resolve_env_vars(value: Any) -> Any:
-    """Recursively resolve ${ENV_VAR} references in config values."""
+
+def _resolve_env_vars(
+    value: Any,
+    _env: dict[str, str] | None = None,
+    _memo: dict[str, str] | None = None,
+) -> Any:
+    """Recursively resolve ${ENV_VAR} references in config values.
+
+    The environment is snapshotted once per top-level call and resolved
+    strings are memoized, so repeated references resolve once.
+    """
+    if _env is None:
+        _env = dict(os.environ)
+        _memo = {}
     if isinstance(value, str):
-        pattern = re.compile(r"\$\{(\w+)\}")
+        if "${" not in value:
+            return value
+        resolved = _memo.get(value)
+        if resolved is not None:
+            return resolved
+        env_get = _env.get
         def replacer(match: re.Match) -> str:
             var_name = match.group(1)
-            env_value = os.environ.get(var_name)
+            env_value = env_get(var_name)
             if env_value is None:
                 logger.warning("Environment variable %s not set", var_name)
                 return match.group(0)  # leave unresolved
             return env_value
-        return pattern.sub(replacer, value)
+        resolved = _memo[value] = _ENV_VAR_RE.sub(replacer, value)
+        return resolved
     elif isinstance(value, dict):
-        return {k: _resolve_env_vars(v) for k, v in value.items()}
+        return {k: _resolve_env_vars(v, _env, _memo) for k, v in value.items()}
     elif isinstance(value, list):
-        return [_resolve_env_vars(item) for item in value]
+        return [_resolve_env_vars(item, _env, _memo) for item in value]
     return value
 
 
@@ -168,6 +185,11 @@ def load_config(
     env_path = Path(env_path)
     config_path = Path(config_path)
 
+    # yaml and dotenv are only needed here; keep them off the import path of
+    # modules that just want the config models.
+    import yaml
+    from dotenv import load_dotenv
+
     # Load .env
     if env_path.exists():
         load_dotenv(env_path)
@@ -178,8 +200,10 @@ def load_config(
     # Load config.yaml
     raw_config: dict = {}
     if config_path.exists():
+        # LibYAML loader when available; parsing a str skips the file-read callbacks.
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
         with open(config_path) as f:
-            raw_config = yaml.safe_load(f) or {}
+            raw_config = yaml.load(f.read(), Loader=loader) or {}
         logger.info("Loaded config from %s", config_path)
     else:
         logger.warning("No config file at %s, using defaults", config_path)
@@ -200,19 +224,25 @@ def load_config(
     return config
 
 
+# Leaf state directories under home; creating these creates every ancestor.
+_STATE_DIRS = (
+    ("events",),
+    ("memos",),
+    ("signals",),
+    ("positions", "ai"),
+    ("positions", "human"),
+    ("memories",),
+    ("tasks",),
+    ("market",),
+    ("simulations",),
+)
+
+
 def _ensure_directories(home: Path) -> None:
     """Create the state directory structure if it doesn't exist."""
-    dirs = [
-        home,
-        home / "events",
-        home / "memos",
-        home / "signals",
-        home / "positions" / "ai",
-        home / "positions" / "human",
-        home / "memories",
-        home / "tasks",
-        home / "market",
-        home / "simulations",
-    ]
-    for d in dirs:
-        d.mkdir(parents=True, exist_ok=True)
+    # One stat per leaf on warm runs; makedirs only for what is missing.
+    home_str = os.fspath(home)
+    for parts in _STATE_DIRS:
+        d = os.path.join(home_str, *parts)
+        if not os.path.isdir(d):
+            os.makedirs(d, exist_ok=True)
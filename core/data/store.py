@@ -6,10 +6,15 @@ SQLite provides indexed queries for market data and memory retrieval.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import os
 import sqlite3
-from datetime import datetime
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import TypeVar
 
@@ -18,10 +23,203 @@ from pydantic import BaseModel
 from core.models.market import MarketData
 from core.models.memories import Memory
 
+try:  # optional: faster JSON for state files and metadata columns
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
+# Connection tuning applied on open (WAL makes synchronous=NORMAL crash-safe).
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA wal_autocheckpoint=1000",
+)
+_SYNCHRONOUS_MODES = frozenset({"OFF", "NORMAL", "FULL", "EXTRA"})
+
+# Buffered conversation messages are committed at this size or after this delay.
+_CONVERSATION_FLUSH_SIZE = 100
+_CONVERSATION_FLUSH_DELAY = 1.0
+
+# Statement text shared across calls (sqlite3 caches prepared statements by SQL text).
+# Upserts update in place instead of INSERT OR REPLACE's delete + reinsert.
+_SQL_INSERT_MARKET = """INSERT INTO market_data
+    (ticker, timestamp, available_at, open, high, low, close,
+     volume, source, data_type, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(ticker, timestamp, source) DO UPDATE SET
+        available_at = excluded.available_at,
+        open = excluded.open,
+        high = excluded.high,
+        low = excluded.low,
+        close = excluded.close,
+        volume = excluded.volume,
+        data_type = excluded.data_type,
+        metadata = excluded.metadata"""
+_SQL_QUERY_MARKET_ASOF = """SELECT * FROM market_data
+    WHERE ticker = ? AND available_at <= ?
+    ORDER BY timestamp DESC LIMIT ?"""
+_SQL_QUERY_MARKET = """SELECT * FROM market_data
+    WHERE ticker = ?
+    ORDER BY timestamp DESC LIMIT ?"""
+_SQL_INSERT_MEMORY = """INSERT INTO memory_index
+    (id, created_at, who_was_right, tags, ticker, confidence_impact, source)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        created_at = excluded.created_at,
+        who_was_right = excluded.who_was_right,
+        tags = excluded.tags,
+        ticker = excluded.ticker,
+        confidence_impact = excluded.confidence_impact,
+        source = excluded.source"""
+_SQL_DELETE_MEMORY_TAGS = "DELETE FROM memory_tags WHERE memory_id = ?"
+_SQL_INSERT_MEMORY_TAG = "INSERT OR IGNORE INTO memory_tags (tag, memory_id) VALUES (?, ?)"
+_SQL_INSERT_CONVERSATION = """INSERT INTO conversation_messages
+    (channel_id, role, content, message_json, created_at)
+    VALUES (?, ?, ?, ?, ?)"""
+_SQL_LOAD_CONVERSATION = """SELECT id, channel_id, role, content, message_json
+    FROM conversation_messages
+    ORDER BY channel_id ASC, created_at ASC, id ASC"""
+_SQL_HAS_LEGACY_CONVERSATION = """SELECT 1 FROM conversation_messages
+    WHERE message_json IS NULL OR message_json = '' LIMIT 1"""
+_SQL_LOAD_CONVERSATION_JSON = """SELECT channel_id, message_json
+    FROM conversation_messages
+    ORDER BY channel_id ASC, created_at ASC, id ASC"""
+# One JSON array per channel, assembled by SQLite (ORDER BY inside an
+# aggregate needs SQLite 3.44+).
+_SQL_LOAD_CONVERSATION_GROUPED = """SELECT channel_id,
+        '[' || group_concat(message_json, ',' ORDER BY created_at ASC, id ASC) || ']'
+    FROM conversation_messages
+    GROUP BY channel_id
+    ORDER BY channel_id ASC"""
+_SQLITE_ORDERED_AGGREGATES = sqlite3.sqlite_version_info >= (3, 44, 0)
+# Keyset pages over one channel; ids are insertion order.
+_SQL_PAGE_CONVERSATION = """SELECT id, channel_id, role, content, message_json
+    FROM conversation_messages
+    WHERE channel_id = ? AND id > ?
+    ORDER BY id ASC
+    LIMIT ?"""
+_SQL_RECENT_CONVERSATION = """SELECT id, channel_id, role, content, message_json
+    FROM conversation_messages
+    WHERE channel_id = ?
+    ORDER BY id DESC
+    LIMIT ?"""
+_CONVERSATION_PAGE_SIZE = 1000
+_SQL_BACKFILL_CONVERSATION = "UPDATE conversation_messages SET message_json = ? WHERE id = ?"
+_SQLITE_CACHED_STATEMENTS = 256
+
+# list_json reads files on a thread pool once a directory has this many.
+_LIST_JSON_PARALLEL_MIN = 32
+_LIST_JSON_WORKERS = 8
+
+# market_data timestamps are INTEGER unix milliseconds (UTC): compact rows,
+# integer range scans on available_at and no ISO parsing on read.
+_SQL_CREATE_MARKET_TABLE = """CREATE TABLE IF NOT EXISTS market_data (
+    ticker TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    available_at INTEGER NOT NULL,
+    open REAL,
+    high REAL,
+    low REAL,
+    close REAL NOT NULL,
+    volume REAL,
+    source TEXT DEFAULT '',
+    data_type TEXT DEFAULT 'price',
+    metadata TEXT,
+    PRIMARY KEY (ticker, timestamp, source)
+)"""
+_SQL_CREATE_MARKET_INDEX = """CREATE INDEX IF NOT EXISTS idx_market_available
+    ON market_data(ticker, available_at)"""
+
+# Remaining tables and indexes. Bump _SCHEMA_VERSION whenever the schema or
+# a migration in Store._init_sqlite changes; it is stored in PRAGMA user_version.
+_SQL_CREATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memory_index (
+    id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    who_was_right TEXT,
+    tags TEXT DEFAULT '',
+    ticker TEXT DEFAULT '',
+    confidence_impact REAL DEFAULT 0.0,
+    source TEXT DEFAULT 'production'
+);
+
+CREATE INDEX IF NOT EXISTS idx_memory_ticker
+    ON memory_index(ticker);
+CREATE INDEX IF NOT EXISTS idx_memory_created
+    ON memory_index(created_at);
+
+CREATE TABLE IF NOT EXISTS memory_tags (
+    tag TEXT NOT NULL COLLATE NOCASE,
+    memory_id TEXT NOT NULL
+        REFERENCES memory_index(id) ON DELETE CASCADE,
+    PRIMARY KEY (tag, memory_id)
+);
+
+CREATE TABLE IF NOT EXISTS conversation_messages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    channel_id TEXT NOT NULL,
+    role TEXT NOT NULL,
+    content TEXT NOT NULL,
+    message_json TEXT,
+    created_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_conversation_channel_created
+    ON conversation_messages(channel_id, created_at, id);
+
+CREATE INDEX IF NOT EXISTS idx_conversation_channel_id
+    ON conversation_messages(channel_id, id);
+"""
+_SCHEMA_VERSION = 1
+
+# Column order of the tuples accepted by Store.save_market_data_rows().
+MARKET_DATA_COLUMNS = (
+    "ticker", "timestamp", "available_at", "open", "high", "low", "close",
+    "volume", "source", "data_type", "metadata",
+)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_epoch_ms(dt: datetime) -> int:
+    """Unix milliseconds for dt; naive datetimes are taken as UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // timedelta(milliseconds=1)
+
+
+def _from_epoch_ms(ms: int) -> datetime:
+    return _EPOCH + timedelta(milliseconds=ms)
+
+
+def _read_bytes_or_error(path: str) -> bytes | OSError:
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError as e:
+        return e
+
+
+def _loads(data: str | bytes) -> object:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _dumps_text(obj: object) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj)
+
 
 class Store:
     """Unified storage layer for files + SQLite.
@@ -29,10 +227,16 @@ class Store:
     All paths are relative to the home directory (~/.clawquant/).
     """
 
-    def __init__(self, home: Path) -> None:
+    def __init__(self, home: Path, synchronous: str = "NORMAL") -> None:
+        synchronous = synchronous.upper()
+        if synchronous not in _SYNCHRONOUS_MODES:
+            raise ValueError(f"Invalid SQLite synchronous mode: {synchronous}")
         self._home = home
         self._db_path = home / "db.sqlite"
+        self._synchronous = synchronous  # OFF suits throwaway stores
         self._db: sqlite3.Connection | None = None
+        self._msg_buffer: deque[tuple[str, str, str, str, str]] = deque()
+        self._msg_flush_handle: asyncio.TimerHandle | None = None
         self._init_sqlite()
 
     # ------------------------------------------------------------------
@@ -41,61 +245,71 @@ class Store:
 
     def _init_sqlite(self) -> None:
         """Initialize SQLite database and create tables if needed."""
-        self._db = sqlite3.connect(str(self._db_path))
+        self._db = sqlite3.connect(str(self._db_path), cached_statements=_SQLITE_CACHED_STATEMENTS)
         self._db.row_factory = sqlite3.Row
-        self._db.execute("PRAGMA journal_mode=WAL")
-        self._db.execute("PRAGMA foreign_keys=ON")
-
-        self._db.executescript("""
-            CREATE TABLE IF NOT EXISTS market_data (
-                ticker TEXT NOT NULL,
-                timestamp TEXT NOT NULL,
-                available_at TEXT NOT NULL,
-                open REAL,
-                high REAL,
-                low REAL,
-                close REAL NOT NULL,
-                volume REAL,
-                source TEXT DEFAULT '',
-                data_type TEXT DEFAULT 'price',
-                metadata TEXT,
-                PRIMARY KEY (ticker, timestamp, source)
-            );
-
-            CREATE INDEX IF NOT EXISTS idx_market_available
-                ON market_data(ticker, available_at);
-
-            CREATE TABLE IF NOT EXISTS memory_index (
-                id TEXT PRIMARY KEY,
-                created_at TEXT NOT NULL,
-                who_was_right TEXT,
-                tags TEXT DEFAULT '',
-                ticker TEXT DEFAULT '',
-                confidence_impact REAL DEFAULT 0.0,
-                source TEXT DEFAULT 'production'
-            );
-
-            CREATE INDEX IF NOT EXISTS idx_memory_ticker
-                ON memory_index(ticker);
-            CREATE INDEX IF NOT EXISTS idx_memory_created
-                ON memory_index(created_at);
-
-            CREATE TABLE IF NOT EXISTS conversation_messages (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                channel_id TEXT NOT NULL,
-                role TEXT NOT NULL,
-                content TEXT NOT NULL,
-                message_json TEXT,
-                created_at TEXT NOT NULL
-            );
-
-            CREATE INDEX IF NOT EXISTS idx_conversation_channel_created
-                ON conversation_messages(channel_id, created_at, id);
-        """)
-        self._ensure_column("conversation_messages", "message_json", "TEXT")
-        self._db.commit()
+        # Connection settings go in one round trip
+        self._db.executescript(
+            ";\n".join((*_SQLITE_PRAGMAS, f"PRAGMA synchronous={self._synchronous}")) + ";"
+        )
+
+        # Schema DDL and migrations only run when the file predates this code
+        version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        if version < _SCHEMA_VERSION:
+            self._migrate_market_timestamps()
+            self._db.execute(_SQL_CREATE_MARKET_TABLE)
+            self._db.execute(_SQL_CREATE_MARKET_INDEX)
+            self._db.executescript(_SQL_CREATE_SCHEMA)
+            self._ensure_column("conversation_messages", "message_json", "TEXT")
+            self._backfill_memory_tags()
+            self._db.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+            self._db.commit()
         logger.info("SQLite initialized at %s", self._db_path)
 
+    def _migrate_market_timestamps(self) -> None:
+        """Rebuild a pre-existing market_data table that stored ISO TEXT timestamps."""
+        rows = self.db.execute("PRAGMA table_info(market_data)").fetchall()
+        types = {str(row["name"]): str(row["type"]).upper() for row in rows}
+        if types.get("timestamp") != "TEXT":
+            return
+
+        logger.info("Migrating market_data timestamps to integer milliseconds")
+        with self.db:
+            self.db.execute("BEGIN")  # make the DDL part of the same transaction
+            self.db.execute("DROP INDEX IF EXISTS idx_market_available")
+            self.db.execute("ALTER TABLE market_data RENAME TO market_data_iso")
+            self.db.execute(_SQL_CREATE_MARKET_TABLE)
+            self.db.execute(_SQL_CREATE_MARKET_INDEX)
+            cursor = self.db.execute(
+                "SELECT ticker, timestamp, available_at, open, high, low, close,"
+                " volume, source, data_type, metadata FROM market_data_iso"
+            )
+            while batch := cursor.fetchmany(10_000):
+                self.db.executemany(_SQL_INSERT_MARKET, [
+                    (
+                        r[0],
+                        _to_epoch_ms(datetime.fromisoformat(r[1])),
+                        _to_epoch_ms(datetime.fromisoformat(r[2])),
+                        *r[3:],
+                    )
+                    for r in batch
+                ])
+            self.db.execute("DROP TABLE market_data_iso")
+
+    def _backfill_memory_tags(self) -> None:
+        """Populate memory_tags from memory_index.tags for indexes built before it existed."""
+        if self.db.execute("SELECT 1 FROM memory_tags LIMIT 1").fetchone():
+            return
+        rows = self.db.execute("SELECT id, tags FROM memory_index WHERE tags != ''").fetchall()
+        pairs = [
+            (tag, row["id"])
+            for row in rows
+            for tag in str(row["tags"]).split(",")
+            if tag
+        ]
+        if pairs:
+            with self.db:
+                self.db.executemany(_SQL_INSERT_MEMORY_TAG, pairs)
+
     def _ensure_column(self, table: str, column: str, definition: str) -> None:
         """Best-effort schema migration for additive columns."""
         rows = self.db.execute(f"PRAGMA table_info({table})").fetchall()
@@ -112,8 +326,9 @@ class Store:
         return self._db
 
     def close(self) -> None:
-        """Close the SQLite connection."""
+        """Flush buffered writes and close the SQLite connection."""
         if self._db:
+            self.flush_conversation()
             self._db.close()
             self._db = None
 
@@ -126,34 +341,50 @@ class Store:
         if not data:
             return 0
 
-        inserted = 0
-        for d in data:
-            try:
-                self.db.execute(
-                    """INSERT OR REPLACE INTO market_data
-                       (ticker, timestamp, available_at, open, high, low, close,
-                        volume, source, data_type, metadata)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        d.ticker,
-                        d.timestamp.isoformat(),
-                        d.available_at.isoformat(),
-                        d.open,
-                        d.high,
-                        d.low,
-                        d.close,
-                        d.volume,
-                        d.source,
-                        d.data_type,
-                        json.dumps(d.metadata) if d.metadata else None,
-                    ),
-                )
-                inserted += 1
-            except sqlite3.Error:
-                logger.exception("Failed to insert market data for %s", d.ticker)
+        rows = [
+            (
+                d.ticker,
+                _to_epoch_ms(d.timestamp),
+                _to_epoch_ms(d.available_at),
+                d.open,
+                d.high,
+                d.low,
+                d.close,
+                d.volume,
+                d.source,
+                d.data_type,
+                _dumps_text(d.metadata) if d.metadata else None,
+            )
+            for d in data
+        ]
+        return self.save_market_data_rows(rows)
+
+    def save_market_data_rows(self, rows: list[tuple]) -> int:
+        """Bulk-insert pre-built market_data tuples, skipping model conversion.
+
+        Each tuple follows MARKET_DATA_COLUMNS: timestamps as integer unix
+        milliseconds (UTC) and metadata as a JSON string or None. Returns count of rows inserted.
+        """
+        if not rows:
+            return 0
 
-        self.db.commit()
-        return inserted
+        before = self.db.total_changes
+        try:
+            # One transaction, one prepared statement for the whole batch
+            with self.db:
+                self.db.executemany(_SQL_INSERT_MARKET, rows)
+        except sqlite3.Error:
+            # The batch was rolled back; retry row by row to keep the good rows
+            # and log the offending tickers. total_changes still counts the
+            # rolled-back inserts, so count from here.
+            before = self.db.total_changes
+            for row in rows:
+                try:
+                    self.db.execute(_SQL_INSERT_MARKET, row)
+                except sqlite3.Error:
+                    logger.exception("Failed to insert market data for %s", row[0])
+            self.db.commit()
+        return self.db.total_changes - before
 
     def query_market_data(
         self,
@@ -163,21 +394,19 @@ class Store:
     ) -> list[MarketData]:
         """Query market data for a ticker, optionally filtered by TimeContext."""
         if as_of:
-            rows = self.db.execute(
-                """SELECT * FROM market_data
-                   WHERE ticker = ? AND available_at <= ?
-                   ORDER BY timestamp DESC LIMIT ?""",
-                (ticker, as_of.isoformat(), limit),
-            ).fetchall()
+            cursor = self.db.execute(
+                _SQL_QUERY_MARKET_ASOF,
+                (ticker, _to_epoch_ms(as_of), limit),
+            )
         else:
-            rows = self.db.execute(
-                """SELECT * FROM market_data
-                   WHERE ticker = ?
-                   ORDER BY timestamp DESC LIMIT ?""",
+            cursor = self.db.execute(
+                _SQL_QUERY_MARKET,
                 (ticker, limit),
-            ).fetchall()
+            )
 
-        return [self._row_to_market_data(r) for r in rows]
+        # Build models straight off the cursor, no intermediate Row list
+        to_model = self._row_to_market_data
+        return [to_model(r) for r in cursor]
 
     def get_latest_price(self, ticker: str, as_of: datetime | None = None) -> float | None:
         """Get the most recent close price for a ticker."""
@@ -185,10 +414,14 @@ class Store:
         return data[0].close if data else None
 
     def _row_to_market_data(self, row: sqlite3.Row) -> MarketData:
-        return MarketData(
+        # Rows were validated on the way in and the REAL columns already come
+        # back as floats, so skip pydantic validation. Timestamps come back as
+        # aware UTC datetimes.
+        metadata = row["metadata"]
+        return MarketData.model_construct(
             ticker=row["ticker"],
-            timestamp=datetime.fromisoformat(row["timestamp"]),
-            available_at=datetime.fromisoformat(row["available_at"]),
+            timestamp=_from_epoch_ms(row["timestamp"]),
+            available_at=_from_epoch_ms(row["available_at"]),
             open=row["open"],
             high=row["high"],
             low=row["low"],
@@ -196,7 +429,7 @@ class Store:
             volume=row["volume"],
             source=row["source"] or "",
             data_type=row["data_type"] or "price",
-            metadata=json.loads(row["metadata"]) if row["metadata"] else None,
+            metadata=_loads(metadata) if metadata else None,
         )
 
     # ------------------------------------------------------------------
@@ -212,21 +445,21 @@ class Store:
                 ticker = tag.lstrip("$")
                 break
 
-        self.db.execute(
-            """INSERT OR REPLACE INTO memory_index
-               (id, created_at, who_was_right, tags, ticker, confidence_impact, source)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (
-                memory.id,
-                memory.created_at.isoformat(),
-                memory.who_was_right,
-                ",".join(memory.tags),
-                ticker,
-                memory.confidence_impact,
-                memory.source,
-            ),
-        )
-        self.db.commit()
+        with self.db:
+            self.db.execute(
+                _SQL_INSERT_MEMORY,
+                (
+                    memory.id,
+                    memory.created_at.isoformat(),
+                    memory.who_was_right,
+                    ",".join(memory.tags),
+                    ticker,
+                    memory.confidence_impact,
+                    memory.source,
+                ),
+            )
+            self.db.execute(_SQL_DELETE_MEMORY_TAGS, (memory.id,))
+            self.db.executemany(_SQL_INSERT_MEMORY_TAG, [(tag, memory.id) for tag in memory.tags if tag])
 
     def search_memories(
         self,
@@ -247,11 +480,10 @@ class Store:
             params.append(ticker)
 
         if tags:
-            tag_conditions = []
-            for tag in tags:
-                tag_conditions.append("tags LIKE ?")
-                params.append(f"%{tag}%")
-            conditions.append(f"({' OR '.join(tag_conditions)})")
+            # Exact (case-insensitive) tag match via the memory_tags index
+            placeholders = ",".join("?" * len(tags))
+            conditions.append(f"id IN (SELECT memory_id FROM memory_tags WHERE tag IN ({placeholders}))")
+            params.extend(tags)
 
         if since:
             conditions.append("created_at >= ?")
@@ -306,8 +538,66 @@ class Store:
         """Append one chat message to persistent conversation history.
 
         Stores both legacy text content and a full JSON message payload for
-        spec-compliant role/content/tool_* reconstruction.
+        spec-compliant role/content/tool_* reconstruction. Inside an event
+        loop, rows are buffered and committed together shortly after (or
+        once the buffer fills); without a loop they are committed at once.
+        """
+        self._msg_buffer.append(
+            self._conversation_row(channel_id, role, content, extra_fields, datetime.now().isoformat())
+        )
+        if len(self._msg_buffer) >= _CONVERSATION_FLUSH_SIZE:
+            self.flush_conversation()
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush_conversation()
+            return
+        if self._msg_flush_handle is None:
+            self._msg_flush_handle = loop.call_later(_CONVERSATION_FLUSH_DELAY, self.flush_conversation)
+
+    def append_conversation_messages(
+        self,
+        messages: Iterable[tuple[str, str, object] | tuple[str, str, object, dict[str, object]]],
+    ) -> None:
+        """Append many chat messages in one transaction.
+
+        Each message is (channel_id, role, content) or
+        (channel_id, role, content, extra_fields).
         """
+        now = datetime.now().isoformat()
+        rows = [
+            self._conversation_row(channel_id, role, content, rest[0] if rest else {}, now)
+            for channel_id, role, content, *rest in messages
+        ]
+        # Keep insertion order with anything still buffered
+        self.flush_conversation()
+        if rows:
+            self._insert_conversation_rows(rows)
+
+    def flush_conversation(self) -> None:
+        """Commit buffered conversation messages."""
+        if self._msg_flush_handle is not None:
+            self._msg_flush_handle.cancel()
+            self._msg_flush_handle = None
+        if not self._msg_buffer:
+            return
+        rows = list(self._msg_buffer)
+        self._msg_buffer.clear()
+        self._insert_conversation_rows(rows)
+
+    def _insert_conversation_rows(self, rows: list[tuple[str, str, str, str, str]]) -> None:
+        with self.db:
+            self.db.executemany(_SQL_INSERT_CONVERSATION, rows)
+
+    def _conversation_row(
+        self,
+        channel_id: str,
+        role: str,
+        content: object,
+        extra_fields: dict[str, object],
+        created_at: str,
+    ) -> tuple[str, str, str, str, str]:
         payload: dict[str, object] = {
             "role": role,
             "content": content,
@@ -318,52 +608,24 @@ class Store:
 
         content_text = self._stringify_content(content)
         payload_json = json.dumps(payload, ensure_ascii=False)
-        self.db.execute(
-            """INSERT INTO conversation_messages (channel_id, role, content, message_json, created_at)
-               VALUES (?, ?, ?, ?, ?)""",
-            (channel_id, role, content_text, payload_json, datetime.now().isoformat()),
-        )
-        self.db.commit()
+        return (channel_id, role, content_text, payload_json, created_at)
 
     def load_conversation_history(self) -> dict[str, list[dict[str, object]]]:
         """Load full persisted conversation history for all channels."""
-        rows = self.db.execute(
-            """SELECT id, channel_id, role, content, message_json
-               FROM conversation_messages
-               ORDER BY channel_id ASC, created_at ASC, id ASC"""
-        ).fetchall()
+        self.flush_conversation()
+        history = self._load_conversation_history_fast()
+        if history is not None:
+            return history
+
+        rows = self.db.execute(_SQL_LOAD_CONVERSATION).fetchall()
 
         history: dict[str, list[dict[str, object]]] = {}
         backfill: list[tuple[str, int]] = []
         for row in rows:
-            channel = row["channel_id"]
-            message_json = row["message_json"]
-            if message_json:
-                try:
-                    parsed = json.loads(message_json)
-                except Exception:
-                    parsed = None
-                if isinstance(parsed, dict) and parsed.get("role"):
-                    history.setdefault(channel, []).append(parsed)
-                    continue
-
-            role = str(row["role"] or "user")
-            legacy_content = self._parse_legacy_content(str(row["content"] or ""))
-
-            # If content itself is a full message payload, normalize it.
-            if isinstance(legacy_content, dict) and legacy_content.get("role"):
-                rebuilt = dict(legacy_content)
-                if "content" not in rebuilt:
-                    rebuilt["content"] = ""
-                if not rebuilt.get("role"):
-                    rebuilt["role"] = role
-            else:
-                rebuilt = {
-                    "role": role,
-                    "content": legacy_content,
-                }
-
-            history.setdefault(channel, []).append(rebuilt)
+            rebuilt, is_legacy = self._row_to_message(row)
+            history.setdefault(row["channel_id"], []).append(rebuilt)
+            if not is_legacy:
+                continue
             try:
                 backfill.append((json.dumps(rebuilt, ensure_ascii=False), int(row["id"])))
             except Exception:
@@ -371,15 +633,97 @@ class Store:
 
         if backfill:
             try:
-                self.db.executemany(
-                    "UPDATE conversation_messages SET message_json = ? WHERE id = ?",
-                    backfill,
-                )
+                self.db.executemany(_SQL_BACKFILL_CONVERSATION, backfill)
                 self.db.commit()
             except Exception:
                 logger.exception("Failed to backfill message_json for legacy conversation rows")
         return history
 
+    def recent_conversation(self, channel_id: str, limit: int = 200) -> list[dict[str, object]]:
+        """Last ``limit`` messages of one channel, oldest first."""
+        self.flush_conversation()
+        rows = self.db.execute(_SQL_RECENT_CONVERSATION, (channel_id, limit)).fetchall()
+        rows.reverse()
+        return [self._row_to_message(row)[0] for row in rows]
+
+    def iter_conversation_history(
+        self,
+        channel_id: str,
+        after_id: int = 0,
+        page: int = _CONVERSATION_PAGE_SIZE,
+    ) -> Iterator[list[dict[str, object]]]:
+        """Yield one channel's messages in pages of up to ``page``, oldest first.
+
+        Pages are fetched with ``id > last_id`` so memory stays bounded by
+        the page size rather than the history length.
+        """
+        self.flush_conversation()
+        last_id = after_id
+        while True:
+            rows = self.db.execute(_SQL_PAGE_CONVERSATION, (channel_id, last_id, page)).fetchall()
+            if not rows:
+                return
+            last_id = rows[-1]["id"]
+            yield [self._row_to_message(row)[0] for row in rows]
+            if len(rows) < page:
+                return
+
+    def _row_to_message(self, row: sqlite3.Row) -> tuple[dict[str, object], bool]:
+        """Decode a conversation row; the flag is True for legacy rows without message_json."""
+        message_json = row["message_json"]
+        if message_json:
+            try:
+                parsed = json.loads(message_json)
+            except Exception:
+                parsed = None
+            if isinstance(parsed, dict) and parsed.get("role"):
+                return parsed, False
+
+        role = str(row["role"] or "user")
+        legacy_content = self._parse_legacy_content(str(row["content"] or ""))
+
+        # If content itself is a full message payload, normalize it.
+        if isinstance(legacy_content, dict) and legacy_content.get("role"):
+            rebuilt = dict(legacy_content)
+            if "content" not in rebuilt:
+                rebuilt["content"] = ""
+            if not rebuilt.get("role"):
+                rebuilt["role"] = role
+        else:
+            rebuilt = {
+                "role": role,
+                "content": legacy_content,
+            }
+        return rebuilt, True
+
+    def _load_conversation_history_fast(self) -> dict[str, list[dict[str, object]]] | None:
+        """Parse each channel's messages with a single json.loads.
+
+        Returns None when any row still needs the legacy per-row path
+        (missing or unparsable message_json), which also backfills it.
+        """
+        if self.db.execute(_SQL_HAS_LEGACY_CONVERSATION).fetchone():
+            return None
+
+        if _SQLITE_ORDERED_AGGREGATES:
+            chunks = self.db.execute(_SQL_LOAD_CONVERSATION_GROUPED).fetchall()
+        else:
+            grouped: dict[str, list[str]] = {}
+            for channel, message_json in self.db.execute(_SQL_LOAD_CONVERSATION_JSON):
+                grouped.setdefault(channel, []).append(message_json)
+            chunks = [(channel, "[" + ",".join(parts) + "]") for channel, parts in grouped.items()]
+
+        history: dict[str, list[dict[str, object]]] = {}
+        for channel, text in chunks:
+            try:
+                messages = json.loads(text)
+            except ValueError:
+                return None
+            if not all(isinstance(m, dict) and m.get("role") for m in messages):
+                return None
+            history[channel] = messages
+        return history
+
     # ------------------------------------------------------------------
     # File operations (JSON, Markdown, JSONL)
     # ------------------------------------------------------------------
@@ -388,7 +732,7 @@ class Store:
         """Write a Pydantic model as a JSON file."""
         path = self._home / subdir / filename
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(model.model_dump_json(indent=2))
+        path.write_bytes(model.model_dump_json(indent=2).encode())
         return path
 
     def read_json(self, subdir: str, filename: str, model_class: type[T]) -> T | None:
@@ -396,26 +740,39 @@ class Store:
         path = self._home / subdir / filename
         if not path.exists():
             return None
+        # model_validate_json parses raw bytes in pydantic-core, skipping the
+        # intermediate Python dict.
         try:
-            data = json.loads(path.read_text())
-            return model_class(**data)
-        except (json.JSONDecodeError, Exception):
+            return model_class.model_validate_json(path.read_bytes())
+        except Exception:
             logger.exception("Failed to read %s", path)
             return None
 
     def list_json(self, subdir: str, model_class: type[T]) -> list[T]:
         """List and parse all JSON files in a subdirectory."""
         dirpath = self._home / subdir
-        if not dirpath.exists():
+        try:
+            with os.scandir(dirpath) as it:
+                paths = sorted(e.path for e in it if e.name.endswith(".json") and e.is_file())
+        except FileNotFoundError:
             return []
 
+        # Large directories overlap file reads on a small thread pool (reads
+        # release the GIL); parsing stays on the calling thread.
+        if len(paths) >= _LIST_JSON_PARALLEL_MIN:
+            with ThreadPoolExecutor(max_workers=_LIST_JSON_WORKERS) as pool:
+                bodies = list(pool.map(_read_bytes_or_error, paths))
+        else:
+            bodies = [_read_bytes_or_error(path) for path in paths]
+
         results = []
-        for filepath in sorted(dirpath.glob("*.json")):
+        for path, body in zip(paths, bodies, strict=True):
             try:
-                data = json.loads(filepath.read_text())
-                results.append(model_class(**data))
-            except (json.JSONDecodeError, Exception):
-                logger.exception("Failed to parse %s", filepath)
+                if isinstance(body, OSError):
+                    raise body
+                results.append(model_class.model_validate_json(body))
+            except Exception:
+                logger.exception("Failed to parse %s", path)
         return results
 
     def delete_file(self, subdir: str, filename: str) -> bool:
@@ -0,0 +1,26 @@
+"""Duration strings used in config.yaml ("60s", "5m", "4h", "7d")."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+
+# Seconds per duration unit suffix
+_DURATION_UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_duration(value: str | int) -> timedelta:
+    """Parse a config duration like "60s", "5m", "4h" or "7d".
+
+    A bare number is taken as seconds. Raises ValueError on anything else.
+    """
+    s = str(value).strip()
+    if not s:
+        raise ValueError("Empty duration")
+    if s.isdigit():
+        return timedelta(seconds=int(s))
+    multiplier = _DURATION_UNIT_SECONDS.get(s[-1].lower())
+    amount = s[:-1].rstrip()
+    if multiplier is None or not amount.isdigit():
+        raise ValueError(f"Invalid duration: {value!r}")
+    return timedelta(seconds=int(amount) * multiplier)
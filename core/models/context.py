@@ -24,6 +24,31 @@ class PortfolioSummary(BaseModel):
     total_pnl_percent: float = 0.0
     sector_exposure: dict[str, float] = Field(default_factory=dict)
 
+    def update_all_pnl(self, prices: dict[str, float]) -> None:
+        """Mark every position with a quote in ``prices`` to market in one pass.
+
+        Same arithmetic as ``Position.update_pnl``. Positions without a price
+        keep their last mark; ``total_value``, ``total_pnl`` and
+        ``total_pnl_percent`` are recomputed in the same loop.
+        """
+        total_pnl = 0.0
+        total_value = 0.0
+        get_price = prices.get
+        for position in self.positions:
+            size = position.size or 1
+            current = get_price(position.ticker)
+            if current is not None:
+                entry = position.entry_price
+                move = current - entry if position.direction == "long" else entry - current
+                position.current_price = current
+                position.pnl = move * size
+                position.pnl_percent = move / entry * 100 if entry else 0.0
+            total_pnl += position.pnl or 0
+            total_value += (position.current_price or position.entry_price) * size
+        self.total_value = total_value
+        self.total_pnl = total_pnl
+        self.total_pnl_percent = (total_pnl / total_value * 100) if total_value else 0
+
 
 class ContextPack(BaseModel):
     """Everything the AI needs to make a decision.
@@ -2,10 +2,47 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
+from typing import Any
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+_now_utc = partial(datetime.now, timezone.utc)
+
+
+def _evt_id() -> str:
+    return f"evt_{uuid4().hex[:12]}"
+
+
+def _correlation_id() -> str:
+    return uuid4().hex[:12]
+
+
+@dataclass(frozen=True, slots=True)
+class IntegrationOutputPayload:
+    """Typed view of an integration.output payload (text already stripped)."""
+
+    text: str
+    adapter: str | None = None
+    channel_id: Any = None
+
+    @classmethod
+    def from_payload(cls, payload: dict | None) -> IntegrationOutputPayload:
+        if not payload:
+            return cls("")
+        get = payload.get
+        raw = get("text")
+        if not raw:
+            text = ""
+        elif isinstance(raw, str):
+            text = raw.strip()
+        else:
+            text = str(raw).strip()
+        return cls(text, get("adapter"), get("channel_id"))
 
 
 class Event(BaseModel):
@@ -15,14 +52,22 @@ class Event(BaseModel):
     to daily JSONL files for auditability.
     """
 
-    id: str = Field(default_factory=lambda: f"evt_{uuid4().hex[:12]}")
+    # Immutable once published.
+    model_config = ConfigDict(frozen=True)
+
+    id: str = Field(default_factory=_evt_id)
     type: str
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    correlation_id: str = Field(default_factory=lambda: uuid4().hex[:12])
+    timestamp: datetime = Field(default_factory=_now_utc)
+    correlation_id: str = Field(default_factory=_correlation_id)
     source: str
     payload: dict = Field(default_factory=dict)
     metadata: dict | None = None
 
+    @property
+    def output_payload(self) -> IntegrationOutputPayload:
+        """The payload read as an integration.output message."""
+        return IntegrationOutputPayload.from_payload(self.payload)
+
     def derive(self, type: str, source: str, payload: dict | None = None) -> Event:
         """Create a new event in the same correlation chain."""
         return Event(
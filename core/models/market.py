@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import partial
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+_now_utc = partial(datetime.now, timezone.utc)
 
 
 class MarketData(BaseModel):
@@ -15,9 +19,11 @@ class MarketData(BaseModel):
     lookahead bias in backtests.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     ticker: str
     timestamp: datetime
-    available_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    available_at: datetime = Field(default_factory=_now_utc)
     open: float | None = None
     high: float | None = None
     low: float | None = None
@@ -31,7 +37,7 @@ class MarketData(BaseModel):
 class MarketSnapshot(BaseModel):
     """A point-in-time view of market state, used in context packs."""
 
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=_now_utc)
     prices: dict[str, float] = Field(default_factory=dict)
     vix: float | None = None
     yields: dict[str, float] = Field(default_factory=dict)
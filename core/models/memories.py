@@ -3,12 +3,20 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import partial
 from typing import Literal
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
 
+_now_utc = partial(datetime.now, timezone.utc)
+
+
+def _mem_id() -> str:
+    return f"mem_{uuid4().hex[:12]}"
+
+
 class Memory(BaseModel):
     """A structured learning generated by the comparison task.
 
@@ -17,8 +25,8 @@ class Memory(BaseModel):
     divergences with the human.
     """
 
-    id: str = Field(default_factory=lambda: f"mem_{uuid4().hex[:12]}")
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    id: str = Field(default_factory=_mem_id)
+    created_at: datetime = Field(default_factory=_now_utc)
     signal_id: str | None = None
 
     # The divergence
@@ -3,11 +3,19 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import partial
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
 
+_now_utc = partial(datetime.now, timezone.utc)
+
+
+def _memo_id() -> str:
+    return f"memo_{uuid4().hex[:12]}"
+
+
 class Scenario(BaseModel):
     """A single scenario in the investment memo's scenario tree."""
 
@@ -24,8 +32,8 @@ class InvestmentMemo(BaseModel):
     Stored on disk as Markdown files in memos/.
     """
 
-    id: str = Field(default_factory=lambda: f"memo_{uuid4().hex[:12]}")
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    id: str = Field(default_factory=_memo_id)
+    created_at: datetime = Field(default_factory=_now_utc)
     correlation_id: str = ""
 
     # Content sections
@@ -3,16 +3,24 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import partial
 from typing import Literal
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+_now_utc = partial(datetime.now, timezone.utc)
+
+
+def _sig_id() -> str:
+    return f"sig_{uuid4().hex[:12]}"
 
 
 class Signal(BaseModel):
     """A trade recommendation produced by the AI and gated by the Risk Engine."""
 
-    id: str = Field(default_factory=lambda: f"sig_{uuid4().hex[:12]}")
+    id: str = Field(default_factory=_sig_id)
     ticker: str
     direction: Literal["buy", "sell", "hold"]
     catalyst: str
@@ -22,7 +30,7 @@ class Signal(BaseModel):
     take_profit: float | None = None
     horizon: str = ""
     memo_id: str = ""
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_now_utc)
     correlation_id: str = ""
 
     # Risk engine fields (populated after gate)
@@ -57,7 +65,7 @@ class Position(BaseModel):
     # Tracking
     portfolio: Literal["ai", "human"]
     signal_id: str | None = None
-    opened_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    opened_at: datetime = Field(default_factory=_now_utc)
     closed_at: datetime | None = None
     close_price: float | None = None
     realized_pnl: float | None = None
@@ -82,6 +90,8 @@ class Position(BaseModel):
 class RuleEvaluation(BaseModel):
     """Result of a single risk rule evaluation."""
 
+    model_config = ConfigDict(frozen=True)
+
     rule_name: str
     passed: bool
     reason: str
@@ -9,6 +9,10 @@ from uuid import uuid4
 from pydantic import BaseModel, Field
 
 
+def _sim_id() -> str:
+    return f"sim_{uuid4().hex[:12]}"
+
+
 class SimulationConfig(BaseModel):
     """Configuration for a simulation run."""
 
@@ -52,7 +56,7 @@ class PerformanceMetrics(BaseModel):
 class SimulationRun(BaseModel):
     """A record of a backtest / simulation run."""
 
-    id: str = Field(default_factory=lambda: f"sim_{uuid4().hex[:12]}")
+    id: str = Field(default_factory=_sim_id)
     name: str
     config: SimulationConfig
     status: Literal["pending", "running", "completed", "failed"] = "pending"
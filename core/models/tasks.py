@@ -3,12 +3,20 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import partial
 from typing import Literal
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
 
+_now_utc = partial(datetime.now, timezone.utc)
+
+
+def _task_id() -> str:
+    return f"task_{uuid4().hex[:12]}"
+
+
 class Task(BaseModel):
     """A scheduled task stored as a JSON file in tasks/.
 
@@ -16,7 +24,7 @@ class Task(BaseModel):
     The AI can create tasks by writing new JSON files.
     """
 
-    id: str = Field(default_factory=lambda: f"task_{uuid4().hex[:12]}")
+    id: str = Field(default_factory=_task_id)
     name: str
     type: Literal["one_off", "recurring", "research", "comparison"] = "recurring"
 
@@ -31,7 +39,7 @@ class Task(BaseModel):
     # Metadata
     enabled: bool = True
     created_by: Literal["human", "ai"] = "human"
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_now_utc)
     parent_task_id: str | None = None
 
     # Execution history
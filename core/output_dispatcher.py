@@ -2,57 +2,165 @@
 
 Consumes integration.output events and delivers text through registered
 output adapters that support send_text().
+
+Messages are coalesced per (adapter, channel) over a short window and then
+handed to the adapter's send_text_batch() when it has one, so a burst of
+outputs costs one delivery instead of one per message.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
 
 from core.models.events import Event
 from core.registry import PluginRegistry
 
 logger = logging.getLogger(__name__)
 
+SendText = Callable[..., Awaitable[Any]]
+
+# Pending messages are delivered after this delay, or at once when a single
+# (adapter, channel) bucket reaches _BATCH_MAX messages.
+_BATCH_WINDOW = 0.005
+_BATCH_MAX = 32
+
 
 class OutputDispatcher:
     """Deliver integration.output events via configured output adapters."""
 
     def __init__(self, registry: PluginRegistry) -> None:
         self._registry = registry
+        # Bound send_text / send_text_batch methods, pre-resolved by the registry
+        self._by_name = registry.output_senders()
+        self._batch_by_name = registry.output_batch_senders()
+        # Broadcast targets, rebuilt whenever an output plugin is registered
+        self._broadcast: tuple[str, ...] = tuple(self._by_name)
+        self._has_outputs = bool(self._broadcast)
+        self._warned_no_outputs = False
+        registry.subscribe_changes(self._on_registry_change)
+        # (adapter, str(channel_id)) -> (channel_id, texts waiting for the next flush)
+        self._pending: dict[tuple[str, str | None], tuple[Any, list[str]]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._inflight: set[asyncio.Task] = set()
+        self._last_delivery: asyncio.Task | None = None
+
+    def _on_registry_change(self, protocol_key: str, name: str) -> None:
+        if protocol_key == "output":
+            self._broadcast = tuple(self._by_name)
+            self._has_outputs = bool(self._broadcast)
 
     async def handle_integration_output(self, event: Event) -> None:
-        payload = event.payload or {}
-        text = str(payload.get("text", "")).strip()
+        if not self._has_outputs:
+            # Nothing can deliver; drop without reading the payload
+            if not self._warned_no_outputs:
+                self._warned_no_outputs = True
+                logger.warning("No output adapters registered; dropping integration.output events")
+            return
+
+        payload = event.output_payload
+        text = payload.text
         if not text:
-            logger.debug("integration.output ignored: missing text")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("integration.output ignored: missing text")
             return
 
-        channel_id = payload.get("channel_id")
-        adapter_name = payload.get("adapter")
+        channel_id = payload.channel_id
+        adapter_name = payload.adapter
 
-        outputs = self._registry.get_all("output")
-        delivered = 0
+        if adapter_name:
+            # Targeted delivery (the common case): a single bucket
+            if adapter_name not in self._by_name:
+                self._warn_undelivered(adapter_name, channel_id)
+                return
+            self._enqueue(adapter_name, channel_id, text)
+            return
+
+        for name in self._broadcast:
+            self._enqueue(name, channel_id, text)
+
+    def _enqueue(self, adapter_name: str, channel_id: Any, text: str) -> None:
+        # Keyed by the channel's string form so unhashable ids can't break
+        # queuing; the adapter still receives the id as given.
+        key = (adapter_name, None if channel_id is None else str(channel_id))
+        entry = self._pending.get(key)
+        if entry is None:
+            entry = self._pending[key] = (channel_id, [])
+        bucket = entry[1]
+        bucket.append(text)
+        if len(bucket) >= _BATCH_MAX:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(_BATCH_WINDOW, self._flush)
 
-        for output in outputs:
-            if adapter_name and getattr(output, "name", None) != adapter_name:
-                continue
+    def _flush(self) -> None:
+        """Hand every pending bucket to a delivery task."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        task = asyncio.get_running_loop().create_task(self._deliver(pending, self._last_delivery))
+        self._last_delivery = task
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _deliver(
+        self,
+        pending: dict[tuple[str, str | None], tuple[Any, list[str]]],
+        previous: asyncio.Task | None,
+    ) -> None:
+        # Flushes run one after another so a channel's messages stay in order
+        if previous is not None and not previous.done():
+            await asyncio.wait((previous,))
+        # Buckets go out concurrently; one failure doesn't stop the rest
+        if len(pending) == 1:
+            ((adapter_name, _), (channel_id, texts)), = pending.items()
+            await self._deliver_bucket(adapter_name, channel_id, texts)
+            return
+        await asyncio.gather(*(
+            self._deliver_bucket(adapter_name, channel_id, texts)
+            for (adapter_name, _), (channel_id, texts) in pending.items()
+        ))
 
-            send_text = getattr(output, "send_text", None)
-            if send_text is None:
-                continue
+    async def _deliver_bucket(self, adapter_name: str, channel_id: Any, texts: list[str]) -> None:
+        """Deliver one bucket in order; per-message sends unless the adapter batches."""
+        send_batch = self._batch_by_name.get(adapter_name) if len(texts) > 1 else None
+        if send_batch is not None:
+            try:
+                await send_batch(texts, channel_id=channel_id)
+                return
+            except Exception:
+                logger.exception("Failed delivering integration.output batch via %s", adapter_name)
+                self._warn_undelivered(adapter_name, channel_id)
+                return
 
+        send_text = self._by_name[adapter_name]
+        delivered = 0
+        for text in texts:
             try:
                 await send_text(text, channel_id=channel_id)
                 delivered += 1
             except Exception:
-                logger.exception(
-                    "Failed delivering integration.output via %s",
-                    getattr(output, "name", "unknown"),
-                )
-
+                logger.exception("Failed delivering integration.output via %s", adapter_name)
         if delivered == 0:
-            logger.warning(
-                "No output adapters delivered integration.output (adapter=%s channel_id=%s)",
-                adapter_name,
-                channel_id,
-            )
+            self._warn_undelivered(adapter_name, channel_id)
+
+    async def aclose(self) -> None:
+        """Deliver anything still pending and wait for in-flight deliveries."""
+        self._flush()
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    @staticmethod
+    def _warn_undelivered(adapter_name: object, channel_id: object) -> None:
+        if not logger.isEnabledFor(logging.WARNING):
+            return
+        logger.warning(
+            "No output adapters delivered integration.output (adapter=%s channel_id=%s)",
+            adapter_name,
+            channel_id,
+        )
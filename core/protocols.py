@@ -5,13 +5,14 @@ The core NEVER imports concrete implementations.
 
 All protocols use Python's structural subtyping (typing.Protocol):
 if your class has the right methods, it implements the protocol.
-No inheritance required.
+No inheritance required. They are static-typing contracts only (not
+runtime_checkable); the registry never isinstance-checks plugins.
 """
 
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Callable, Coroutine, Protocol, runtime_checkable
+from typing import Any, Callable, Coroutine, Protocol
 
 from core.models.context import ContextPack, PortfolioSummary
 from core.models.events import Event
@@ -25,7 +26,6 @@ from core.models.tasks import TaskResult
 # 1. EventBus -- inter-component communication
 # ---------------------------------------------------------------------------
 
-@runtime_checkable
 class EventBus(Protocol):
     """Publish/subscribe event bus. All inter-component communication
     flows through this protocol.
@@ -51,7 +51,6 @@ class EventBus(Protocol):
 # 2. MarketDataProvider -- fetch price/market data for any asset
 # ---------------------------------------------------------------------------
 
-@runtime_checkable
 class MarketDataProvider(Protocol):
     """Fetches market data for tickers it supports.
 
@@ -87,7 +86,6 @@ class MarketDataProvider(Protocol):
 # 3. InputAdapter -- receive data from external sources
 # ---------------------------------------------------------------------------
 
-@runtime_checkable
 class InputAdapter(Protocol):
     """Receives data from an external source and pushes events into the system.
 
@@ -120,11 +118,15 @@ class InputAdapter(Protocol):
 # 4. OutputAdapter -- deliver signals to external destinations
 # ---------------------------------------------------------------------------
 
-@runtime_checkable
 class OutputAdapter(Protocol):
     """Delivers signals and notifications to an external destination.
 
     Examples: Telegram message, email, webhook POST.
+
+    Adapters that can post free-form text (integration.output events) also
+    define ``async send_text(text, channel_id=None)``, and may define
+    ``async send_text_batch(texts, channel_id=None)`` to deliver several
+    queued messages to one channel at once.
     """
 
     @property
@@ -143,6 +145,8 @@ class OutputAdapter(Protocol):
 class DeliveryResult:
     """Result of an OutputAdapter.send() call."""
 
+    __slots__ = ("success", "adapter", "message")
+
     def __init__(self, success: bool, adapter: str, message: str = ""):
         self.success = success
         self.adapter = adapter
@@ -157,7 +161,6 @@ class DeliveryResult:
 # 5. LLMProvider -- call language model APIs
 # ---------------------------------------------------------------------------
 
-@runtime_checkable
 class LLMProvider(Protocol):
     """Abstracts language model API calls.
 
@@ -187,6 +190,8 @@ class LLMProvider(Protocol):
 class ToolCallResult:
     """Result of an LLMProvider.tool_call() invocation."""
 
+    __slots__ = ("text", "tool_calls", "usage")
+
     def __init__(
         self,
         text: str = "",
@@ -206,7 +211,6 @@ class ToolCallResult:
 # 6. AIAgent -- individual analysis agent
 # ---------------------------------------------------------------------------
 
-@runtime_checkable
 class AIAgent(Protocol):
     """A self-contained analysis unit in the agent pipeline.
 
@@ -232,6 +236,8 @@ class AIAgent(Protocol):
 class AgentOutput:
     """Output produced by an AIAgent."""
 
+    __slots__ = ("agent_name", "analysis", "confidence", "suggested_direction", "key_factors")
+
     def __init__(
         self,
         agent_name: str,
@@ -251,7 +257,6 @@ class AgentOutput:
 # 7. RiskRule -- evaluate a signal against a rule
 # ---------------------------------------------------------------------------
 
-@runtime_checkable
 class RiskRule(Protocol):
     """A single risk rule that evaluates signals.
 
@@ -277,7 +282,6 @@ class RiskRule(Protocol):
 # 8. TaskHandler -- execute a scheduled task
 # ---------------------------------------------------------------------------
 
-@runtime_checkable
 class TaskHandler(Protocol):
     """Handles execution of a scheduled task.
 
@@ -7,6 +7,9 @@ them here. Core components query the registry for implementations by protocol ty
 from __future__ import annotations
 
 import logging
+import sys
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 from typing import Any, TypeVar
 
 from core.protocols import (
@@ -35,6 +38,9 @@ PROTOCOL_TYPES = {
     "risk_rule": RiskRule,
     "task_handler": TaskHandler,
 }
+_MISSING = object()
+_PROTOCOL_KEYS = frozenset(PROTOCOL_TYPES)
+_PROTOCOL_KEYS_TEXT = str(list(PROTOCOL_TYPES))  # for error messages
 
 
 class PluginRegistry:
@@ -45,71 +51,154 @@ class PluginRegistry:
         registry.register("market_data", yahoo_finance_provider)
         registry.register("market_data", coingecko_provider)
 
-        providers = registry.get_all("market_data")  # [yahoo, coingecko]
+        providers = registry.get_all("market_data")  # (yahoo, coingecko)
         yahoo = registry.get("market_data", "yahoo_finance")
     """
 
     def __init__(self) -> None:
-        self._plugins: dict[str, dict[str, Any]] = {key: {} for key in PROTOCOL_TYPES}
+        # Flat (protocol_key, name) index for get/has, plus per-type lists in
+        # registration order for get_all/names.
+        self._by_key: dict[tuple[str, str], Any] = {}
+        self._by_type: dict[str, list[Any]] = {key: [] for key in PROTOCOL_TYPES}
+        self._names: dict[str, list[str]] = {key: [] for key in PROTOCOL_TYPES}
+        # Immutable views handed out by get_all/names, rebuilt lazily after
+        # a registration touches that protocol type.
+        self._snapshots: dict[str, tuple[Any, ...]] = {}
+        self._name_snapshots: dict[str, tuple[str, ...]] = {}
+        # Output adapters' bound send_text / send_text_batch methods,
+        # resolved at registration
+        self._output_senders: dict[str, Callable[..., Any]] = {}
+        self._output_senders_view = MappingProxyType(self._output_senders)
+        self._output_batch_senders: dict[str, Callable[..., Any]] = {}
+        self._output_batch_senders_view = MappingProxyType(self._output_batch_senders)
+        self._version = 0  # bumped on every registration
+        self._change_callbacks: list[Callable[[str, str], None]] = []
 
     def register(self, protocol_key: str, instance: Any) -> None:
         """Register a plugin instance under a protocol type.
 
         The instance must have a `name` property.
         """
-        if protocol_key not in PROTOCOL_TYPES:
+        if protocol_key not in _PROTOCOL_KEYS:
             raise ValueError(
                 f"Unknown protocol key '{protocol_key}'. "
-                f"Must be one of: {list(PROTOCOL_TYPES.keys())}"
+                f"Must be one of: {_PROTOCOL_KEYS_TEXT}"
             )
 
         name = instance.name
-        if name in self._plugins[protocol_key]:
+        if type(name) is str:
+            name = sys.intern(name)  # names often come from config at runtime
+        key = (protocol_key, name)
+        if key in self._by_key:
             logger.warning(
                 "Overwriting existing %s plugin '%s'", protocol_key, name
             )
+            # Replace in place to keep the original registration order
+            self._by_type[protocol_key][self._names[protocol_key].index(name)] = instance
+        else:
+            self._by_type[protocol_key].append(instance)
+            self._names[protocol_key].append(name)
+
+        self._by_key[key] = instance
+        if protocol_key == "output":
+            send_text = getattr(instance, "send_text", None)
+            send_text_batch = getattr(instance, "send_text_batch", None)
+            if send_text is None:
+                self._output_senders.pop(name, None)
+            else:
+                self._output_senders[name] = send_text
+            if send_text is None or send_text_batch is None:
+                self._output_batch_senders.pop(name, None)
+            else:
+                self._output_batch_senders[name] = send_text_batch
+        self._snapshots.pop(protocol_key, None)
+        self._name_snapshots.pop(protocol_key, None)
+        self._version += 1
+        for callback in self._change_callbacks:
+            try:
+                callback(protocol_key, name)
+            except Exception:
+                logger.exception("Registry change callback failed for %s plugin '%s'", protocol_key, name)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Registered %s plugin: %s", protocol_key, name)
+
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever a plugin is registered.
+
+        Lets callers cache lookups derived from the registry and rebuild
+        them only when it changes.
+        """
+        return self._version
+
+    def subscribe_changes(self, callback: Callable[[str, str], None]) -> None:
+        """Call ``callback(protocol_key, name)`` after every registration.
 
-        self._plugins[protocol_key][name] = instance
-        logger.info("Registered %s plugin: %s", protocol_key, name)
+        For consumers that keep derived views of the registry and want to
+        rebuild them eagerly rather than polling ``version``. A callback that
+        raises is logged and does not affect the registration or other callbacks.
+        """
+        self._change_callbacks.append(callback)
 
     def get(self, protocol_key: str, name: str) -> Any:
         """Get a specific plugin by protocol type and name.
 
         Raises KeyError if not found.
         """
-        if protocol_key not in self._plugins:
+        instance = self._by_key.get((protocol_key, name), _MISSING)
+        if instance is not _MISSING:
+            return instance
+        if protocol_key not in self._names:
             raise KeyError(f"Unknown protocol key: {protocol_key}")
-        if name not in self._plugins[protocol_key]:
-            available = list(self._plugins[protocol_key].keys())
-            raise KeyError(
-                f"No {protocol_key} plugin named '{name}'. "
-                f"Available: {available}"
-            )
-        return self._plugins[protocol_key][name]
+        available = list(self._names[protocol_key])
+        raise KeyError(
+            f"No {protocol_key} plugin named '{name}'. "
+            f"Available: {available}"
+        )
 
-    def get_all(self, protocol_key: str) -> list[Any]:
-        """Get all plugins registered for a protocol type."""
-        if protocol_key not in self._plugins:
-            raise KeyError(f"Unknown protocol key: {protocol_key}")
-        return list(self._plugins[protocol_key].values())
+    def get_all(self, protocol_key: str) -> tuple[Any, ...]:
+        """Get all plugins registered for a protocol type.
+
+        Returns a shared tuple that is only rebuilt after a registration.
+        """
+        snapshot = self._snapshots.get(protocol_key)
+        if snapshot is None:
+            if protocol_key not in self._by_type:
+                raise KeyError(f"Unknown protocol key: {protocol_key}")
+            snapshot = self._snapshots[protocol_key] = tuple(self._by_type[protocol_key])
+        return snapshot
+
+    def output_senders(self) -> Mapping[str, Callable[..., Any]]:
+        """Read-only live map of output adapter name -> bound send_text.
+
+        Output adapters without send_text are left out.
+        """
+        return self._output_senders_view
+
+    def output_batch_senders(self) -> Mapping[str, Callable[..., Any]]:
+        """Read-only live map of output adapter name -> bound send_text_batch.
+
+        Only adapters that also have send_text are included.
+        """
+        return self._output_batch_senders_view
 
     def has(self, protocol_key: str, name: str) -> bool:
         """Check if a plugin is registered."""
-        return (
-            protocol_key in self._plugins
-            and name in self._plugins[protocol_key]
-        )
+        return (protocol_key, name) in self._by_key
 
-    def names(self, protocol_key: str) -> list[str]:
+    def names(self, protocol_key: str) -> tuple[str, ...]:
         """List all registered plugin names for a protocol type."""
-        if protocol_key not in self._plugins:
-            return []
-        return list(self._plugins[protocol_key].keys())
+        snapshot = self._name_snapshots.get(protocol_key)
+        if snapshot is None:
+            if protocol_key not in self._names:
+                return ()
+            snapshot = self._name_snapshots[protocol_key] = tuple(self._names[protocol_key])
+        return snapshot
 
     def summary(self) -> dict[str, list[str]]:
         """Return a summary of all registered plugins."""
         return {
-            key: list(plugins.keys())
-            for key, plugins in self._plugins.items()
-            if plugins
+            key: list(names)
+            for key, names in self._names.items()
+            if names
         }
@@ -7,19 +7,32 @@ All data queries pass through TimeContext for filtering.
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import partial
 from typing import Literal
 
-from pydantic import BaseModel, Field
 
+_now_utc = partial(datetime.now, timezone.utc)
+_MODES = frozenset({"production", "simulation"})
 
-class TimeContext(BaseModel):
-    """Controls temporal visibility for the entire system."""
 
-    current_time: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+@dataclass(slots=True)
+class TimeContext:
+    """Controls temporal visibility for the entire system.
+
+    A plain slotted dataclass rather than a pydantic model: simulations
+    create and advance many of these, and the fields need no coercion.
+    """
+
+    current_time: datetime = field(default_factory=_now_utc)
     mode: Literal["production", "simulation"] = "production"
     simulation_id: str | None = None
 
+    def __post_init__(self) -> None:
+        if self.mode not in _MODES:
+            raise ValueError(f"Invalid TimeContext mode: {self.mode!r}")
+
     @classmethod
     def now(cls) -> TimeContext:
         """Create a production-mode TimeContext with real current time."""
@@ -18,6 +18,7 @@ from aiohttp import web
 from core.bus import AsyncIOBus
 from core.config import load_config
 from core.data.store import Store
+from core.duration import parse_duration
 from core.models.events import Event, EventTypes
 from core.output_dispatcher import OutputDispatcher
 from core.registry import PluginRegistry
@@ -414,9 +415,8 @@ async def run(config_path: str | None = None, env_path: str | None = None) -> No
     bus = AsyncIOBus(events_dir=config.home_path / "events")
     registry = PluginRegistry()
 
-    # Parse check interval from config (e.g., "60s" -> 60)
-    check_interval_str = config.scheduler.check_interval
-    check_interval = int(check_interval_str.rstrip("s"))
+    # Parse check interval from config (e.g., "60s" -> 60, "5m" -> 300)
+    check_interval = int(parse_duration(config.scheduler.check_interval).total_seconds())
 
     # Initialize scheduler
     scheduler = Scheduler(
@@ -475,6 +475,7 @@ async def run(config_path: str | None = None, env_path: str | None = None) -> No
     finally:
         logger.info("Shutting down...")
         await scheduler.stop()
+        await output_dispatcher.aclose()
 
         # Stop all input integrations (dedupe because adapters can implement input+output)
         stopped: set[int] = set()
@@ -498,6 +499,7 @@ async def run(config_path: str | None = None, env_path: str | None = None) -> No
             except Exception as e:
                 logger.error("Error closing LLM provider %s: %s", getattr(provider, "name", "?"), e)
 
+        await bus.aclose()
         store.close()
         await runner.cleanup()
         logger.info("Shutdown complete")
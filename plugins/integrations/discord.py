@@ -271,15 +271,20 @@ class DiscordIntegration:
         )
 
     async def send_text(self, text: str, channel_id: str | None = None) -> None:
+        await self.send_text_batch([text], channel_id=channel_id)
+
+    async def send_text_batch(self, texts: list[str], channel_id: str | None = None) -> None:
+        """Send several queued messages in order, each as its own message."""
         targets = self._output_channels
         if channel_id:
             targets = [ch for ch in self._channels if ch.get("id") == channel_id or str(ch.get("chat_id")) == channel_id]
 
         for channel in targets:
-            try:
-                await self._send_message(str(channel["chat_id"]), text)
-            except Exception:
-                logger.exception("Failed to send text to Discord channel %s", channel.get("chat_id"))
+            for text in texts:
+                try:
+                    await self._send_message(str(channel["chat_id"]), text)
+                except Exception:
+                    logger.exception("Failed to send text to Discord channel %s", channel.get("chat_id"))
 
     async def _send_message(self, channel_id: str, text: str) -> dict:
         # Discord content limit is 2000 chars.
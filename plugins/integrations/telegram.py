@@ -246,15 +246,20 @@ class TelegramIntegration:
 
     async def send_text(self, text: str, channel_id: str | None = None) -> None:
         """Send a raw text message to a specific channel or all output channels."""
+        await self.send_text_batch([text], channel_id=channel_id)
+
+    async def send_text_batch(self, texts: list[str], channel_id: str | None = None) -> None:
+        """Send several queued messages in order, each as its own message."""
         targets = self._output_channels
         if channel_id:
             targets = [ch for ch in self._channels if ch.get("id") == channel_id or ch.get("chat_id") == channel_id]
 
         for channel in targets:
-            try:
-                await self._send_message(channel["chat_id"], text)
-            except Exception:
-                logger.exception("Failed to send text to %s", channel.get("chat_id"))
+            for text in texts:
+                try:
+                    await self._send_message(channel["chat_id"], text)
+                except Exception:
+                    logger.exception("Failed to send text to %s", channel.get("chat_id"))
 
     async def _send_message(self, chat_id: str, text: str) -> dict:
         """Send a message via the Telegram Bot API."""
@@ -25,8 +25,15 @@ class PortfolioTracker:
     # Read portfolio state
     # ------------------------------------------------------------------
 
-    def get_summary(self, portfolio_type: str) -> PortfolioSummary:
-        """Build a PortfolioSummary from position files."""
+    def get_summary(
+        self,
+        portfolio_type: str,
+        prices: dict[str, float] | None = None,
+    ) -> PortfolioSummary:
+        """Build a PortfolioSummary from position files.
+
+        When ``prices`` is given, open positions are marked to those quotes first.
+        """
         subdir = f"positions/{portfolio_type}"
         positions = self._store.list_json(subdir, Position)
 
@@ -37,13 +44,16 @@ class PortfolioTracker:
             (p.current_price or p.entry_price) * (p.size or 1) for p in open_positions
         )
 
-        return PortfolioSummary(
+        summary = PortfolioSummary(
             portfolio_type=portfolio_type,  # type: ignore[arg-type]
             total_value=total_value,
             positions=open_positions,
             total_pnl=total_pnl,
             total_pnl_percent=(total_pnl / total_value * 100) if total_value else 0,
         )
+        if prices:
+            summary.update_all_pnl(prices)
+        return summary
 
     def get_position(self, portfolio_type: str, ticker: str) -> Position | None:
         """Get a specific position by ticker."""
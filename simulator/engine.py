@@ -66,6 +66,8 @@ class SimulationEngine:
             run.name, config.date_range[0], config.date_range[1], config.ai_provider,
         )
 
+        sim_store: Store | None = None
+        sim_bus: AsyncIOBus | None = None
         try:
             # Set up sandboxed environment
             sim_dir = self._store._home / "simulations" / run.id
@@ -110,6 +112,8 @@ class SimulationEngine:
             # Replay events
             signal_count = 0
             for event in events:
+                # A fresh context per event: nothing handed to an earlier
+                # analysis can see later timestamps.
                 tc = TimeContext.at(event.timestamp, run.id)
 
                 try:
@@ -147,9 +151,6 @@ class SimulationEngine:
                 run.name, signal_count, metrics.sharpe_ratio, metrics.total_return * 100,
             )
 
-            # Clean up sandbox store
-            sim_store.close()
-
         except Exception as e:
             logger.exception("Simulation failed")
             run.mark_failed(str(e))
@@ -159,6 +160,13 @@ class SimulationEngine:
                 run,
             )
 
+        finally:
+            # Flush the sandbox event log and close its store, failed runs included
+            if sim_bus is not None:
+                await sim_bus.aclose()
+            if sim_store is not None:
+                sim_store.close()
+
         return run
 
     async def _sync_historical_data(
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
+from itertools import accumulate
 
 
 @dataclass
@@ -36,17 +37,20 @@ def calculate_metrics(
     if not trades:
         return _empty_metrics()
 
+    # Pull the per-trade numbers out once; everything below works on floats.
+    pnls = [t.pnl for t in trades]
+    winners = [p for p in pnls if p > 0]
+    losers = [p for p in pnls if p <= 0]
+
     # Basic counts
-    total_trades = len(trades)
-    winners = [t for t in trades if t.pnl > 0]
-    losers = [t for t in trades if t.pnl <= 0]
+    total_trades = len(pnls)
 
     # P&L
-    total_pnl = sum(t.pnl for t in trades)
+    total_pnl = sum(pnls)
     total_return = total_pnl / initial_capital
 
-    gross_profit = sum(t.pnl for t in winners)
-    gross_loss = abs(sum(t.pnl for t in losers))
+    gross_profit = sum(winners)
+    gross_loss = abs(sum(losers))
 
     # Hit rate
     hit_rate = len(winners) / total_trades if total_trades else 0
@@ -60,7 +64,7 @@ def calculate_metrics(
     profit_factor = gross_profit / gross_loss if gross_loss > 0 else float("inf")
 
     # Build equity curve for Sharpe, drawdown, etc.
-    equity_curve = _build_equity_curve(trades, initial_capital)
+    equity_curve = _build_equity_curve(pnls, initial_capital)
 
     # CAGR
     total_days = sum(t.holding_days for t in trades)
@@ -108,14 +112,9 @@ def _empty_metrics() -> dict:
     }
 
 
-def _build_equity_curve(trades: list[Trade], initial_capital: float) -> list[float]:
-    """Build a simple equity curve from sequential trades."""
-    curve = [initial_capital]
-    equity = initial_capital
-    for t in trades:
-        equity += t.pnl
-        curve.append(equity)
-    return curve
+def _build_equity_curve(pnls: list[float], initial_capital: float) -> list[float]:
+    """Build a simple equity curve from sequential trade P&Ls."""
+    return list(accumulate(pnls, initial=initial_capital))
 
 
 def _daily_returns(equity_curve: list[float]) -> list[float]:
@@ -123,9 +122,9 @@ def _daily_returns(equity_curve: list[float]) -> list[float]:
     if len(equity_curve) < 2:
         return []
     return [
-        (equity_curve[i] - equity_curve[i - 1]) / equity_curve[i - 1]
-        for i in range(1, len(equity_curve))
-        if equity_curve[i - 1] > 0
+        (cur - prev) / prev
+        for prev, cur in zip(equity_curve[:-1], equity_curve[1:], strict=True)
+        if prev > 0
     ]
 
 
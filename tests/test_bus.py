@@ -0,0 +1,144 @@
+import asyncio
+import json
+
+from core.bus import AsyncIOBus
+from core.models.events import Event
+
+
+def _event(event_type="test.event", **payload):
+    return Event(type=event_type, source="tests", payload=payload)
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def _audit_types(events_dir):
+    return [
+        json.loads(line)["type"]
+        for path in sorted(events_dir.glob("*.jsonl"))
+        for line in path.read_text().splitlines()
+    ]
+
+
+def test_handlers_start_in_subscription_order_typed_before_wildcard(tmp_path):
+    bus = AsyncIOBus(events_dir=tmp_path)
+    calls = []
+
+    def handler(label):
+        async def handle(event):
+            calls.append(label)
+        return handle
+
+    async def main():
+        bus.subscribe("*", handler("wildcard"))
+        bus.subscribe("test.event", handler("first"))
+        bus.subscribe("test.event", handler("second"))
+        await bus.publish(_event())
+        await bus.aclose()
+
+    _run(main())
+    assert calls == ["first", "second", "wildcard"]
+
+
+def test_failing_handler_does_not_affect_publisher_or_others(tmp_path):
+    bus = AsyncIOBus(events_dir=tmp_path)
+    seen = []
+
+    async def broken(event):
+        raise RuntimeError("boom")
+
+    async def ok(event):
+        seen.append(event.id)
+
+    async def main():
+        bus.subscribe("test.event", broken)
+        await bus.publish(_event())  # a lone failing handler
+        bus.subscribe("test.event", ok)
+        event = _event()
+        await bus.publish(event)
+        await bus.aclose()
+        return event
+
+    event = _run(main())
+    assert seen == [event.id]
+
+
+def test_handler_runs_in_its_own_task(tmp_path):
+    bus = AsyncIOBus(events_dir=tmp_path)
+    tasks = []
+
+    async def handle(event):
+        tasks.append(asyncio.current_task())
+
+    async def main():
+        bus.subscribe("test.event", handle)
+        await bus.publish(_event())
+        await bus.aclose()
+        return asyncio.current_task()
+
+    publisher = _run(main())
+    assert tasks and tasks[0] is not publisher
+
+
+def test_duplicate_subscription_runs_once_and_detached_handlers_finish_on_close(tmp_path):
+    bus = AsyncIOBus(events_dir=tmp_path)
+    calls = []
+
+    async def slow(event):
+        await asyncio.sleep(0.01)
+        calls.append(event.id)
+
+    async def main():
+        bus.subscribe("test.event", slow)
+        bus.subscribe("test.event", slow, await_completion=False)
+        await bus.publish(_event())
+        assert calls == []  # publish() did not wait
+        await bus.aclose()
+
+    _run(main())
+    assert len(calls) == 1
+    assert bus.subscriber_count("test.event") == 1
+
+
+def test_audit_log_is_batched_and_flushed_on_close(tmp_path):
+    bus = AsyncIOBus(events_dir=tmp_path)
+
+    async def main():
+        for i in range(5):
+            await bus.publish(_event(f"batched.{i}"))
+        written_before_close = _audit_types(tmp_path)
+        await bus.aclose()
+        return written_before_close
+
+    assert _run(main()) == []  # still waiting in the writer's batch
+    assert _audit_types(tmp_path) == [f"batched.{i}" for i in range(5)]
+
+
+def test_signal_approved_is_written_through_in_order(tmp_path):
+    bus = AsyncIOBus(events_dir=tmp_path)
+
+    async def main():
+        await bus.publish(_event("before"))
+        await bus.publish(_event("signal.approved"))
+        visible = _audit_types(tmp_path)
+        await bus.publish(_event("after"))
+        await bus.aclose()
+        return visible
+
+    assert _run(main()) == ["before", "signal.approved"]
+    assert _audit_types(tmp_path) == ["before", "signal.approved", "after"]
+
+
+def test_recent_returns_newest_first_filtered_by_type(tmp_path):
+    bus = AsyncIOBus(events_dir=tmp_path)
+
+    async def main():
+        for event_type in ("a", "b", "a"):
+            await bus.publish(_event(event_type, n=event_type))
+        await bus.aclose()
+
+    _run(main())
+    assert [e.type for e in bus.recent()] == ["a", "b", "a"]
+    assert len(bus.recent(event_type="a")) == 2
+    assert len(bus.recent(n=1)) == 1
@@ -0,0 +1,82 @@
+import subprocess
+
+import yaml
+
+from cli import main as cli_main
+
+
+def _write_config(path, data):
+    path.write_text(yaml.safe_dump(data, sort_keys=False))
+
+
+def test_sidecar_skipped_for_non_string_keys(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    _write_config(config_path, {"weights": {1: 0.5, 2: 0.25}})
+
+    assert cli_main._load_yaml_cached(config_path) == {"weights": {1: 0.5, 2: 0.25}}
+    assert not cli_main._config_sidecar_path(config_path).exists()
+
+
+def test_sidecar_reused_while_config_unchanged(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    _write_config(config_path, {"updates": {"auto_update": True}})
+
+    first = cli_main._load_yaml_cached(config_path)
+    assert cli_main._config_sidecar_path(config_path).exists()
+
+    cli_main._CONFIG_CACHE.clear()
+    assert cli_main._load_yaml_cached(config_path) == first
+
+
+def test_save_install_commit_preserves_int_keys(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    _write_config(config_path, {"weights": {1: 0.5}, "updates": {"auto_update": False}})
+    cli_main._load_yaml_cached(config_path)
+
+    commit = "a" * 40
+    cli_main._save_install_commit(config_path, commit)
+
+    saved = yaml.safe_load(config_path.read_text())
+    assert saved["weights"] == {1: 0.5}
+    assert saved["updates"] == {"auto_update": False, "install_commit": commit}
+    assert cli_main._load_update_preferences(config_path) == (False, commit)
+
+
+def _pip(monkeypatch, returncode):
+    calls = []
+
+    def check_call(cmd, cwd=None):
+        calls.append(cmd)
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, cmd)
+        return 0
+
+    monkeypatch.setattr(subprocess, "check_call", check_call)
+    return calls
+
+
+def test_requirements_stamp_written_only_after_pip_succeeds(tmp_path, monkeypatch):
+    monkeypatch.setenv("CLAWQUANT_HOME", str(tmp_path / "home"))
+    (tmp_path / "home").mkdir()
+    (tmp_path / "requirements.txt").write_text("pyyaml>=6.0\n")
+    stamp = tmp_path / "home" / cli_main._REQUIREMENTS_STAMP
+
+    calls = _pip(monkeypatch, returncode=1)
+    assert cli_main._refresh_dependencies(tmp_path) is False
+    assert len(calls) == 1 and not stamp.exists()
+
+    calls = _pip(monkeypatch, returncode=0)
+    assert cli_main._refresh_dependencies(tmp_path) is True
+    assert stamp.read_text() == cli_main._requirements_digest(tmp_path)
+
+    assert cli_main._refresh_dependencies(tmp_path) is True
+    assert len(calls) == 1  # unchanged requirements skip pip
+
+
+def test_requirements_digest_covers_the_interpreter(tmp_path, monkeypatch):
+    (tmp_path / "requirements.txt").write_text("pyyaml>=6.0\n")
+    before = cli_main._requirements_digest(tmp_path)
+
+    monkeypatch.setattr(cli_main.sys, "prefix", str(tmp_path / "other-venv"))
+
+    assert cli_main._requirements_digest(tmp_path) != before
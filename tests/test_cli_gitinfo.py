@@ -0,0 +1,50 @@
+import os
+
+from cli import gitinfo
+
+SHA_A = "a" * 40
+SHA_B = "b" * 40
+
+
+def _git_dir(tmp_path, head="ref: refs/heads/main\n"):
+    git_dir = tmp_path / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text(head)
+    return git_dir
+
+
+def test_reads_loose_branch_ref(tmp_path):
+    git_dir = _git_dir(tmp_path)
+    (git_dir / "refs" / "heads" / "main").write_text(SHA_A + "\n")
+
+    assert gitinfo._read_head_commit(tmp_path) == SHA_A
+
+
+def test_reads_packed_ref(tmp_path):
+    git_dir = _git_dir(tmp_path)
+    (git_dir / "packed-refs").write_text(f"# pack-refs with: peeled\n{SHA_B} refs/heads/main\n")
+
+    assert gitinfo._read_head_commit(tmp_path) == SHA_B
+
+
+def test_reads_detached_head(tmp_path):
+    _git_dir(tmp_path, head=SHA_A + "\n")
+
+    assert gitinfo._read_head_commit(tmp_path) == SHA_A
+
+
+def test_head_stamp_changes_when_branch_moves(tmp_path):
+    git_dir = _git_dir(tmp_path)
+    ref = git_dir / "refs" / "heads" / "main"
+    ref.write_text(SHA_A + "\n")
+    before = gitinfo.repo_head_stamp(tmp_path)
+
+    ref.write_text(SHA_B + "\n")
+    st = ref.stat()
+    os.utime(ref, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert before and gitinfo.repo_head_stamp(tmp_path) != before
+
+
+def test_head_stamp_empty_outside_a_checkout(tmp_path):
+    assert gitinfo.repo_head_stamp(tmp_path) == ""
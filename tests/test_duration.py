@@ -0,0 +1,28 @@
+from datetime import timedelta
+
+import pytest
+
+from core.duration import parse_duration
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("60s", timedelta(seconds=60)),
+        ("5m", timedelta(minutes=5)),
+        ("4h", timedelta(hours=4)),
+        ("7d", timedelta(days=7)),
+        ("2H", timedelta(hours=2)),
+        (" 10 m ", timedelta(minutes=10)),
+        ("90", timedelta(seconds=90)),
+        (30, timedelta(seconds=30)),
+    ],
+)
+def test_parse_duration_units(value, expected):
+    assert parse_duration(value) == expected
+
+
+@pytest.mark.parametrize("value", ["", "   ", "5w", "m", "1.5h", "-5m", "five minutes"])
+def test_parse_duration_rejects_bad_input(value):
+    with pytest.raises(ValueError):
+        parse_duration(value)
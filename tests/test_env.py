@@ -0,0 +1,47 @@
+from cli.setup import _read_env
+from core.config import _resolve_env_vars
+
+
+def test_read_env_parses_wizard_and_hand_edited_lines(tmp_path):
+    env_path = tmp_path / ".env"
+    env_path.write_text(
+        "# written by clawquant setup\n"
+        "TELEGRAM_BOT_TOKEN=abc123\n"
+        "export OPENAI_API_KEY = sk-test\n"
+        'QUOTED="value with # hash"\n'
+        "SINGLE='x'\n"
+        "INLINE=plain # trailing comment\n"
+        "EMPTY=\n"
+        "URL=https://example.com/?a=b\n"
+        "not a pair\n"
+        "=missing-key\n"
+    )
+
+    assert _read_env(env_path) == {
+        "TELEGRAM_BOT_TOKEN": "abc123",
+        "OPENAI_API_KEY": "sk-test",
+        "QUOTED": "value with # hash",
+        "SINGLE": "x",
+        "INLINE": "plain",
+        "EMPTY": "",
+        "URL": "https://example.com/?a=b",
+    }
+
+
+def test_read_env_missing_file(tmp_path):
+    assert _read_env(tmp_path / ".env") == {}
+
+
+def test_resolve_env_vars_in_nested_config(monkeypatch):
+    monkeypatch.setenv("CQ_TOKEN", "secret")
+    monkeypatch.delenv("CQ_MISSING", raising=False)
+
+    resolved = _resolve_env_vars({
+        "telegram": {"token": "${CQ_TOKEN}", "channels": ["id-${CQ_TOKEN}", 42]},
+        "other": "${CQ_MISSING}",
+    })
+
+    assert resolved == {
+        "telegram": {"token": "secret", "channels": ["id-secret", 42]},
+        "other": "${CQ_MISSING}",
+    }
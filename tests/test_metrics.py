@@ -0,0 +1,14 @@
+import pytest
+
+from simulator.metrics import _build_equity_curve, _daily_returns
+
+
+def test_equity_curve_accumulates_trade_pnl():
+    assert _build_equity_curve([100.0, -50.0, 25.0], 1_000.0) == [1_000.0, 1_100.0, 1_050.0, 1_075.0]
+
+
+def test_daily_returns_pair_consecutive_points():
+    returns = _daily_returns([100.0, 110.0, 99.0])
+
+    assert returns == pytest.approx([0.10, -0.10])
+    assert _daily_returns([100.0]) == []
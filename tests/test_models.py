@@ -0,0 +1,16 @@
+import pydantic
+import pytest
+
+from core.models.events import Event
+
+
+def test_event_is_frozen():
+    event = Event(type="test", source="tests")
+    with pytest.raises(pydantic.ValidationError):
+        event.type = "other"
+
+
+def test_event_ignores_unknown_fields():
+    # Audit logs written by other versions may carry extra keys.
+    event = Event.model_validate({"type": "test", "source": "tests", "legacy": 1})
+    assert event.type == "test"
@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from core.models.events import Event, EventTypes
+from core.output_dispatcher import OutputDispatcher
+from core.registry import PluginRegistry
+
+
+class RecordingOutput:
+    def __init__(self, name="recorder", batching=True):
+        self._name = name
+        self.calls = []
+        if not batching:
+            self.send_text_batch = None
+
+    @property
+    def name(self):
+        return self._name
+
+    async def send(self, signal, memo=None):
+        return None
+
+    async def send_text(self, text, channel_id=None):
+        self.calls.append(("text", channel_id, text))
+
+    async def send_text_batch(self, texts, channel_id=None):
+        self.calls.append(("batch", channel_id, list(texts)))
+
+
+def _output(text, **payload):
+    return Event(type=EventTypes.INTEGRATION_OUTPUT, source="test", payload={"text": text, **payload})
+
+
+async def _dispatch(dispatcher, events):
+    for event in events:
+        await dispatcher.handle_integration_output(event)
+    await dispatcher.aclose()
+
+
+def test_burst_is_coalesced_per_channel_in_order():
+    registry = PluginRegistry()
+    output = RecordingOutput()
+    registry.register("output", output)
+    dispatcher = OutputDispatcher(registry)
+
+    asyncio.run(_dispatch(dispatcher, [
+        _output("one", channel_id="a"),
+        _output("two", channel_id="b"),
+        _output("three", channel_id="a"),
+    ]))
+
+    assert sorted(output.calls, key=str) == sorted([
+        ("batch", "a", ["one", "three"]),
+        ("text", "b", "two"),
+    ], key=str)
+
+
+def test_unhashable_channel_id_is_delivered_unchanged():
+    registry = PluginRegistry()
+    output = RecordingOutput()
+    registry.register("output", output)
+    dispatcher = OutputDispatcher(registry)
+
+    asyncio.run(_dispatch(dispatcher, [_output("hello", adapter="recorder", channel_id=["room", 1])]))
+
+    assert output.calls == [("text", ["room", 1], "hello")]
+
+
+def test_registry_change_enables_delivery():
+    registry = PluginRegistry()
+    dispatcher = OutputDispatcher(registry)
+    output = RecordingOutput(batching=False)
+    registry.register("output", output)
+
+    asyncio.run(_dispatch(dispatcher, [_output("a"), _output("b")]))
+
+    assert output.calls == [("text", None, "a"), ("text", None, "b")]
+
+
+def test_telegram_batch_sends_each_message():
+    pytest.importorskip("httpx")
+    from plugins.integrations.telegram import TelegramIntegration
+
+    telegram = TelegramIntegration("token", channels=[{"id": "main", "chat_id": "42", "direction": "output"}])
+    sent = []
+
+    async def fake_send(chat_id, text):
+        sent.append((chat_id, text))
+        return {"ok": True}
+
+    telegram._send_message = fake_send
+    asyncio.run(telegram.send_text_batch(["first", "second"], channel_id="main"))
+
+    assert sent == [("42", "first"), ("42", "second")]
@@ -0,0 +1,37 @@
+import pytest
+
+from core.data.store import Store
+from core.models.signals import Position
+from risk.portfolio import PortfolioTracker
+
+
+def _positions():
+    return [
+        Position(ticker="AAPL", direction="long", size=10, entry_price=100.0, status="monitoring", portfolio="ai"),
+        Position(ticker="TSLA", direction="short", size=2, entry_price=250.0, status="monitoring", portfolio="ai"),
+        Position(ticker="MSFT", direction="long", entry_price=300.0, current_price=310.0, pnl=10.0,
+                 status="monitoring", portfolio="ai"),
+    ]
+
+
+def test_summary_marks_positions_like_update_pnl(tmp_path):
+    store = Store(tmp_path)
+    for position in _positions():
+        store.write_json("positions/ai", f"{position.ticker}.json", position)
+    prices = {"AAPL": 110.0, "TSLA": 240.0}
+
+    summary = PortfolioTracker(store).get_summary("ai", prices=prices)
+
+    expected = {p.ticker: p for p in _positions()}
+    for ticker, price in prices.items():
+        expected[ticker].update_pnl(price)
+    for position in summary.positions:
+        reference = expected[position.ticker]
+        assert position.current_price == reference.current_price
+        assert position.pnl == pytest.approx(reference.pnl)
+        assert position.pnl_percent == pytest.approx(reference.pnl_percent)
+
+    assert summary.total_value == pytest.approx(110.0 * 10 + 240.0 * 2 + 310.0)
+    assert summary.total_pnl == pytest.approx(100.0 + 20.0 + 10.0)
+    assert summary.total_pnl_percent == pytest.approx(summary.total_pnl / summary.total_value * 100)
+    store.close()
@@ -0,0 +1,66 @@
+import pytest
+
+from core.registry import PluginRegistry
+
+
+class Plugin:
+    def __init__(self, name):
+        self.name = name
+
+
+def test_register_and_lookup_keep_registration_order():
+    registry = PluginRegistry()
+    first, second = Plugin("yahoo"), Plugin("coingecko")
+    registry.register("market_data", first)
+    registry.register("market_data", second)
+
+    assert registry.get("market_data", "yahoo") is first
+    assert registry.get_all("market_data") == (first, second)
+    assert registry.names("market_data") == ("yahoo", "coingecko")
+    assert registry.has("market_data", "coingecko")
+    with pytest.raises(KeyError):
+        registry.get("market_data", "missing")
+
+
+def test_overwrite_replaces_in_place():
+    registry = PluginRegistry()
+    registry.register("market_data", Plugin("a"))
+    registry.register("market_data", Plugin("b"))
+    replacement = Plugin("a")
+    registry.register("market_data", replacement)
+
+    assert registry.get_all("market_data")[0] is replacement
+    assert registry.names("market_data") == ("a", "b")
+
+
+def test_unknown_protocol_key_raises():
+    with pytest.raises(ValueError):
+        PluginRegistry().register("nope", Plugin("x"))
+
+
+def test_change_callbacks_run_after_each_registration():
+    registry = PluginRegistry()
+    seen = []
+    registry.subscribe_changes(lambda key, name: seen.append((key, name, registry.version)))
+
+    registry.register("agent", Plugin("macro"))
+    registry.register("output", Plugin("telegram"))
+
+    assert seen == [("agent", "macro", 1), ("output", "telegram", 2)]
+
+
+def test_failing_change_callback_is_isolated(caplog):
+    registry = PluginRegistry()
+    seen = []
+
+    def broken(key, name):
+        raise RuntimeError("boom")
+
+    registry.subscribe_changes(broken)
+    registry.subscribe_changes(lambda key, name: seen.append(name))
+    plugin = Plugin("macro")
+    registry.register("agent", plugin)
+
+    assert registry.get("agent", "macro") is plugin
+    assert seen == ["macro"]
+    assert "Registry change callback failed" in caplog.text
@@ -0,0 +1,33 @@
+import asyncio
+
+from core.bus import AsyncIOBus
+from core.data.store import Store
+from core.models.simulations import SimulationConfig
+from core.registry import PluginRegistry
+from simulator.engine import SimulationEngine
+
+
+def test_failed_run_still_closes_the_sandbox_bus(tmp_path, monkeypatch):
+    closed = []
+    original_aclose = AsyncIOBus.aclose
+
+    async def aclose(self):
+        closed.append(self)
+        await original_aclose(self)
+
+    async def broken_sync(*args, **kwargs):
+        raise RuntimeError("provider down")
+
+    monkeypatch.setattr(AsyncIOBus, "aclose", aclose)
+    monkeypatch.setattr(SimulationEngine, "_sync_historical_data", broken_sync)
+    store = Store(tmp_path)
+
+    run = asyncio.run(
+        SimulationEngine(store, PluginRegistry()).run_simulation(
+            SimulationConfig(date_range=("2024-01-01", "2024-01-05"))
+        )
+    )
+
+    assert run.status == "failed"
+    assert len(closed) == 1
+    store.close()
@@ -0,0 +1,113 @@
+import asyncio
+import sqlite3
+from datetime import datetime, timezone
+
+from core.data.store import _SCHEMA_VERSION, Store
+from core.models.market import MarketData
+
+
+def _bar(day, close, **fields):
+    ts = datetime(2024, 1, day, tzinfo=timezone.utc)
+    return MarketData(ticker="AAPL", timestamp=ts, available_at=ts, close=close, source="test", **fields)
+
+
+def test_market_data_round_trip(tmp_path):
+    store = Store(tmp_path)
+    saved = store.save_market_data([
+        _bar(1, 100.0, metadata={"adjusted": True}),
+        _bar(2, 101.5, volume=1_000.0),
+    ])
+
+    rows = store.query_market_data("AAPL")
+
+    assert saved == 2
+    assert [row.close for row in rows] == [101.5, 100.0]
+    assert rows[0].timestamp == datetime(2024, 1, 2, tzinfo=timezone.utc)
+    assert rows[0].volume == 1_000.0
+    assert rows[1].metadata == {"adjusted": True}
+    store.close()
+
+
+def test_market_data_upserts_and_filters_as_of(tmp_path):
+    store = Store(tmp_path)
+    store.save_market_data([_bar(1, 100.0), _bar(2, 101.0), _bar(3, 102.0)])
+    store.save_market_data([_bar(2, 99.0)])
+
+    assert len(store.query_market_data("AAPL")) == 3
+    assert store.get_latest_price("AAPL", as_of=datetime(2024, 1, 2, 12, tzinfo=timezone.utc)) == 99.0
+    assert store.get_latest_price("MSFT") is None
+    store.close()
+
+
+def test_bad_rows_do_not_drop_the_rest_of_the_batch(tmp_path):
+    store = Store(tmp_path)
+    good = (
+        "AAPL", 1_704_067_200_000, 1_704_067_200_000,
+        None, None, None, 100.0, None, "test", "price", None,
+    )
+    bad = ("AAPL", 1_704_153_600_000, 1_704_153_600_000, None, None, None, None, None, "test", "price", None)
+
+    inserted = store.save_market_data_rows([good, bad])
+
+    assert inserted == 1
+    assert [row.close for row in store.query_market_data("AAPL")] == [100.0]
+    store.close()
+
+
+def test_buffered_conversation_is_visible_to_immediate_reads(tmp_path):
+    store = Store(tmp_path)
+
+    async def write_then_read():
+        # Inside a loop appends are buffered; reads must flush them first.
+        for i in range(5):
+            store.append_conversation_message("chan", "user", f"message {i}")
+        store.append_conversation_message("other", "user", "elsewhere")
+        recent = store.recent_conversation("chan", limit=2)
+        pages = list(store.iter_conversation_history("chan", page=2))
+        return recent, pages
+
+    recent, pages = asyncio.run(write_then_read())
+
+    assert [m["content"] for m in recent] == ["message 3", "message 4"]
+    assert [len(p) for p in pages] == [2, 2, 1]
+    assert [m["content"] for p in pages for m in p] == [f"message {i}" for i in range(5)]
+    store.close()
+
+
+def test_legacy_iso_market_data_is_migrated(tmp_path):
+    legacy = sqlite3.connect(tmp_path / "db.sqlite")
+    legacy.executescript("""
+        CREATE TABLE market_data (
+            ticker TEXT NOT NULL, timestamp TEXT NOT NULL, available_at TEXT NOT NULL,
+            open REAL, high REAL, low REAL, close REAL NOT NULL, volume REAL,
+            source TEXT DEFAULT '', data_type TEXT DEFAULT 'price', metadata TEXT,
+            PRIMARY KEY (ticker, timestamp, source)
+        );
+        INSERT INTO market_data (ticker, timestamp, available_at, close, source)
+            VALUES ('AAPL', '2024-01-02T00:00:00+00:00', '2024-01-02T00:00:00+00:00', 101.0, 'test');
+    """)
+    legacy.close()
+
+    store = Store(tmp_path)
+
+    assert store.db.execute("PRAGMA user_version").fetchone()[0] == _SCHEMA_VERSION
+    (row,) = store.query_market_data("AAPL")
+    assert row.timestamp == datetime(2024, 1, 2, tzinfo=timezone.utc)
+    assert row.close == 101.0
+    store.close()
+
+
+def test_schema_setup_only_runs_for_older_files(tmp_path):
+    Store(tmp_path).close()
+    db = sqlite3.connect(tmp_path / "db.sqlite")
+    db.execute("DROP INDEX idx_conversation_channel_id")
+    db.commit()
+    db.close()
+
+    store = Store(tmp_path)
+    indexes = {row[0] for row in store.db.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+    # Same user_version: the DDL was skipped, so the dropped index stays gone
+    assert "idx_conversation_channel_id" not in indexes
+    assert "idx_market_available" in indexes
+    store.close()